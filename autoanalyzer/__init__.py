@@ -1,8 +1,9 @@
-from autoanalyzer.data_frame import DataFrame, read_csv, read_excel
+from autoanalyzer.data_frame import (
+    DataFrame, read_csv, read_csv_chunks, read_excel)
 from autoanalyzer.series import Series
 from autoanalyzer.writer import Writer
 from autoanalyzer.table_generator import TableGenerator
 from autoanalyzer.table import Table
 from autoanalyzer.summary import Summary
-from autoanalyzer.hgroup import Hgroup
-from autoanalyzer.analysis import Analysis
\ No newline at end of file
+from autoanalyzer.analysis import Analysis
+from autoanalyzer.estimators.streaming import StreamingOLS
\ No newline at end of file
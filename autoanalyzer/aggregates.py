@@ -0,0 +1,120 @@
+##############################################################################
+# Aggregates
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+import pandas as pd
+import numpy as np
+
+'''
+Mergeable partial aggregates of a summary variable for every group
+the aggregates of a grouping have a slot for each group value, and a last
+slot for rows with no group value, so that the slots of a grouping cover
+every row
+Data:
+    N: numpy array of the number of observations of each slot
+    sums: numpy array of the sum of each slot (None if not computed)
+    M2: numpy array of the sum of squared deviations from the mean of each
+        slot (None if not computed)
+    counts: 2-D numpy array of the count of each unique value in each slot
+        (None if not computed)
+    uniques: pandas Index of sorted unique values, the columns of counts
+NOTE: merged aggregates are exact; M2 is merged by the parallel algorithm
+    of Chan et al.
+'''
+class Aggregates():
+    def __init__(self, N, sums=None, M2=None, counts=None, uniques=None):
+        self._N = N
+        self._sums = sums
+        self._M2 = M2
+        self._counts = counts
+        self._uniques = uniques
+
+    # Compute aggregates of values by group
+    # arguments:
+    #   values: numpy array of non-missing values, whose original values
+    #     are the keys of the counts
+    #   codes: numpy array of the group of each value (-1: no group)
+    #   ngroups: number of groups
+    #   sums, M2, counts: indicators to compute sums, M2 and counts
+    @classmethod
+    def compute(cls, values, codes, ngroups, sums, M2, counts):
+        slots = np.where(codes >= 0, codes, ngroups)
+        nslots = ngroups + 1
+        out = cls(np.bincount(slots, minlength=nslots))
+        if sums:
+            floats = values.astype(float)
+            out._sums = np.bincount(slots, floats, nslots)
+        if M2:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = out._sums / out._N
+            out._M2 = np.bincount(slots, (floats-means[slots])**2, nslots)
+        if counts:
+            try:
+                val_codes, out._uniques = pd.factorize(values, sort=True)
+            except TypeError:
+                val_codes, out._uniques = pd.factorize(values)
+            out._uniques = pd.Index(out._uniques)
+            nuniques = len(out._uniques)
+            out._counts = np.bincount(
+                slots*nuniques + val_codes, minlength=nslots*nuniques)
+            out._counts = out._counts.reshape(nslots, nuniques)
+        return out
+
+    # Merge aggregates of several groupings into the slots of a new
+    # grouping
+    # arguments:
+    #   parts: [(Aggregates, numpy array of the new slot of each slot)]
+    #   nslots: number of slots of the new grouping
+    @classmethod
+    def merge(cls, parts, nslots):
+        aggs = [a for a, mapping in parts]
+        mapping = np.concatenate([m for a, m in parts])
+        N = np.concatenate([a._N for a in aggs])
+        out = cls(np.bincount(mapping, N, nslots).astype(int))
+        if aggs[0]._sums is not None:
+            sums = np.concatenate([a._sums for a in aggs])
+            out._sums = np.bincount(mapping, sums, nslots)
+        if aggs[0]._M2 is not None:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                deviations = np.where(
+                    N > 0, sums/N - out._sums[mapping]/out._N[mapping], 0)
+            out._M2 = np.bincount(
+                mapping, np.concatenate([a._M2 for a in aggs])
+                + N*deviations**2, nslots)
+        if aggs[0]._counts is not None:
+            out._uniques = pd.Index(
+                np.concatenate([a._uniques for a in aggs])).unique()
+            try:
+                out._uniques = out._uniques.sort_values()
+            except TypeError:
+                pass
+            out._counts = np.zeros((nslots, len(out._uniques)), dtype=int)
+            for a, m in parts:
+                cols = out._uniques.get_indexer(a._uniques)
+                np.add.at(out._counts, (m[:,None], cols[None,:]), a._counts)
+        return out
+
+    # Fill the cells of each group with number of observations, mean,
+    # standard deviation and frequencies
+    # arguments:
+    #   store: CellStore of the groups
+    #   var: summary variable
+    def fill(self, store, var):
+        ngroups = len(store)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            N = self._N[:ngroups]
+            store.set('N', var, N)
+            if self._sums is not None:
+                store.set('mean', var, self._sums[:ngroups] / N)
+            if self._M2 is not None:
+                store.set('std', var, np.sqrt(self._M2[:ngroups] / (N-1)))
+        if self._counts is not None:
+            freqs = []
+            for group_counts, n in zip(self._counts[:ngroups], N):
+                order = np.argsort(-group_counts, kind='stable')
+                order = order[group_counts[order] > 0]
+                freqs.append(
+                    [(self._uniques[i], group_counts[i]/n) for i in order])
+            store.extend('freq', var, freqs)
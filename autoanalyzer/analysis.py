@@ -6,43 +6,93 @@
 
 from autoanalyzer.bases.block_base import BlockBase
 from autoanalyzer.bases.writer_base import POOLED_VAL
+from autoanalyzer.estimators import ols, binary, streaming
 from copy import deepcopy
 import statsmodels.api as sm
+import pandas as pd
+import numpy as np
 import xlsxwriter
 
+# Regression models and their default titles
+MODELS = {
+    'ols': 'Least Squares Regression', 
+    'logit': 'Logit Regression', 
+    'probit': 'Probit Regression'}
+
+# Estimation engines
+# grouped: all values of a grouping are fit at once by grouped estimators
+# numpy: each value is fit separately by the minimal estimators
+# statsmodels: each value is fit separately by statsmodels
+# streaming: all values of a grouping are fit at once from sufficient 
+#   statistics accumulated over chunks of rows (see chunks)
+ENGINES = ['grouped', 'numpy', 'statsmodels', 'streaming']
+
+# Covariance types supported with absorbed fixed effects
+# (leverage of HC2 and HC3 would require the fixed effects' projection)
+ABSORB_COV_TYPES = ['nonrobust', 'HC0', 'HC1', 'cluster']
+
 '''
 Data:
-    title
-    y: response variable, dependent variable, label variable
+    title (default: title of the model)
+    model: regression model (see MODELS)
+    y: response variable, dependent variable, label variable, or a list of 
+        them (regressions of all response variables share the regressors)
     regressors: independent variables, to be displayed in table
     controls: control variables, will not be displayed in table
+    absorb: categorical variables whose fixed effects are absorbed by 
+        demeaning, will not be displayed in table
     cov_type: covariance type (see statsmodels documentation)
     cov_kwds: covariance keywords (see statsmodels documentation)
     NOTE: cov_kwds refers to variable names here, but will be converted to
         pandas Series for analysis
-    const: indicates constant should be included in regression
+    const: indicates constant should be included in regression (the 
+        constant is absorbed when absorb is specified)
+    engine: estimation engine (see ENGINES); covariance types the grouped 
+        engine does not support are fit by statsmodels
+    chunks: iterable of DataFrame chunks which can be iterated over more
+        than once (e.g. read_csv_chunks), whose rows are, in order, the 
+        rows of the TableGenerator's DataFrame; the streaming engine reads
+        the regression variables from the chunks rather than the DataFrame,
+        which need only hold the group variables
     table: parent Table
+    start: {response variable: parameters of the pooled fit}, starting 
+        values of logit and probit fits
 '''
 class Analysis(BlockBase):
     def __init__(
             self, table=None, y=None, regressors=[], controls=[],
-            cov_type='nonrobust', cov_kwds={}, const=True,
-            title='Least Squares Regression'):
-        self._init_block(table, title)
+            cov_type='nonrobust', cov_kwds={}, const=True, title=None,
+            absorb=[], engine='grouped', model='ols', chunks=None):
+        self.model(model)
+        self._init_block(table, MODELS[model] if title is None else title)
+        self._start = {}
         self.y(y)
         self.regressors(regressors)
         self.controls(controls)
+        self.absorb(absorb)
         self.cov_type(cov_type)
         self.cov_kwds(cov_kwds)
         self.const(const)
+        self.engine(engine)
+        self.chunks(chunks)
+        
+    # Set regression model
+    def model(self, model='ols'):
+        if model not in MODELS:
+            raise ValueError('Unknown regression model: '+str(model))
+        self._model = model
         
-    # Set dependent variable
+    # Get regression model
+    def get_model(self):
+        return self._model
+        
+    # Set dependent variable, or list of dependent variables
     def y(self, y=None):
         self._y = y
         
-    # Get dependent variable
+    # Get dependent variable, or list of dependent variables
     def get_y(self):
-        return self._y
+        return deepcopy(self._y)
         
     # Set regressors
     def regressors(self, regressors=[]):
@@ -64,6 +114,16 @@ class Analysis(BlockBase):
     def get_controls(self):
         return deepcopy(self._controls)
         
+    # Set absorbed fixed effects
+    def absorb(self, absorb=[]):
+        if type(absorb) == str:
+            absorb = [absorb]
+        self._absorb = absorb
+        
+    # Get absorbed fixed effects
+    def get_absorb(self):
+        return deepcopy(self._absorb)
+        
     # Set covariance type
     def cov_type(self, cov_type='nonrobust'):
         self._cov_type = cov_type
@@ -88,9 +148,69 @@ class Analysis(BlockBase):
     def get_const(self):
         return self._const
         
+    # Set estimation engine
+    def engine(self, engine='grouped'):
+        if engine not in ENGINES:
+            raise ValueError('Unknown estimation engine: '+str(engine))
+        self._engine = engine
+        
+    # Get estimation engine
+    def get_engine(self):
+        return self._engine
+        
+    # Set chunks of rows of the streaming engine
+    def chunks(self, chunks=None):
+        self._chunks = chunks
+        
+    # Get chunks of rows of the streaming engine
+    def get_chunks(self):
+        return self._chunks
+        
     # Get the number of columns in output
+    # one column group of regressors for each dependent variable
     def ncols(self):
-        return len(self._regressors)
+        return len(self._outcomes()) * len(self._regressors)
+        
+    # Get variables of the DataFrame used to generate the block
+    # (none for the streaming engine, which reads them from chunks)
+    def _data_vars(self):
+        if self._engine == 'streaming':
+            return []
+        groups = self._cov_kwds.get('groups')
+        return (self._outcomes() + self._exog() + self._absorb 
+            + [groups]*(type(groups) == str))
+        
+    # Get the list of dependent variables
+    def _outcomes(self):
+        return self._y if type(self._y) == list else [self._y]
+        
+    # Get column variables
+    # a single dependent variable has a column for each regressor
+    # multiple dependent variables have a column for each 
+    # (dependent variable, regressor)
+    def _col_vars(self):
+        if type(self._y) != list:
+            return self._regressors
+        return [(y, v) for y in self._y for v in self._regressors]
+        
+    # Get the column heading of a column variable
+    def _col_label(self, col_var):
+        if type(col_var) != tuple:
+            return self._label(col_var)
+        y, v = col_var
+        return self._label(y) + '\n' + self._label(v)
+        
+    # Get the label of a variable
+    # variables read from chunks, which are not in the DataFrame, are 
+    # labeled by their names
+    def _label(self, var):
+        return self._df._vars.get(var, {}).get('label', str(var))
+        
+    # Get the dependent variable and regressor of a column variable
+    def _col_names(self, col_var):
+        if type(col_var) != tuple:
+            return (self._y, col_var)
+        return col_var
     
     
     
@@ -99,30 +219,279 @@ class Analysis(BlockBase):
     ##########################################################################
     
     # Generate a row of analysis statistics cells
-    # must be assigned to table
-    def generate(self):
-        self._init_row('analysis')
-        results = self._generate_results()
-        [self._row[v].param(results.params[v]) for v in self._regressors]
-        [self._row[v].bse(results.bse[v]) for v in self._regressors]
-        [self._row[v].tvalue(results.tvalues[v]) 
-            for v in self._regressors]
-        [self._row[v].pvalue(results.pvalues[v]) 
-            for v in self._regressors]
-        
-    # Generates analysis results
-    def _generate_results(self):
-        df = deepcopy(self._table._vgroup_df)
+    # arguments:
+    #   df: DataFrame of the row's vertical group value
+    #   vgroup: vertical group variable
+    #   val: vertical group value
+    def _generate_frame(self, df, vgroup, val):
+        store = self._cells[vgroup]
+        rows = [store._index[val]]
+        for y in self._outcomes():
+            X, results, converged = self._generate_results(y, df)
+            self._fill(
+                store, X, *[np.asarray(a)[None] for a in [
+                    results.params, results.bse, results.tvalues, 
+                    results.pvalues]], y, converged, rows)
+            
+    # Generate rows of analysis statistics cells for every value of a 
+    # grouping
+    # the regressions of all values are fit at once by grouped OLS
+    # other engines, and covariance types not supported by grouped OLS, 
+    # are fit one value at a time
+    # dependent variables with the same missing rows share one 
+    # factorization of the regressors
+    # absorbed fixed effects are removed by demeaning within each value
+    # logit and probit models are fit by grouped Newton's method when the 
+    # covariance is nonrobust
+    def _generate_grouping(self, grouping):
+        store = self._init_cells(
+            'analysis', grouping._group, grouping._values)
+        if self._engine == 'streaming':
+            if self._model != 'ols' or self._absorb or self._chunks is None:
+                raise ValueError(
+                    "engine='streaming' requires model='ols', chunks, and "
+                    'no absorbed fixed effects')
+            return self._generate_streaming(grouping)
+        if self._model != 'ols':
+            if self._absorb:
+                raise ValueError(
+                    "Absorbed fixed effects require model='ols'")
+            if self._engine == 'grouped' and self._binary_cov():
+                return self._generate_binary(grouping)
+            return BlockBase._generate_grouping(self, grouping)
+        if self._engine != 'grouped' or not self._grouped_cov():
+            if self._absorb:
+                raise ValueError(
+                    "Absorbed fixed effects require engine='grouped' and "
+                    'cov_type in ' + str(ABSORB_COV_TYPES))
+            return BlockBase._generate_grouping(self, grouping)
+        
+        X, outcomes = self._exog(), self._outcomes()
+        cols = grouping._df._columns(X)
+        codes = grouping._codes
+        clusters = None
+        if self._cov_type == 'cluster':
+            clusters = self._table._get_codes(self._cov_kwds['groups'])
+        absorb = [self._table._get_codes(v) for v in self._absorb]
+        complete = (codes >= 0) & self._complete(cols)
+        if clusters is not None:
+            complete &= clusters >= 0
+        for fe in absorb:
+            complete &= fe >= 0
+        exog = np.column_stack([cols[v] for v in X]).astype(float)
+        Y = np.column_stack([grouping._df._columns([y])[y] 
+            for y in outcomes]).astype(float)
+            
+        missing = np.isnan(Y[complete])
+        for pattern in self._missing_patterns(missing):
+            subset = complete.copy()
+            subset[complete] = ~missing[:,pattern[0]]
+            exog_s, Y_s, df_absorbed = exog[subset], Y[subset][:,pattern], None
+            if absorb:
+                demeaned, df_absorbed = ols.grouped_demean(
+                    np.column_stack([exog_s, Y_s]), codes[subset], 
+                    len(store), [fe[subset] for fe in absorb])
+                exog_s, Y_s = np.hsplit(demeaned, [len(X)])
+            results = ols.grouped_ols_multi(
+                Y_s, exog_s, codes[subset], len(store), self._cov_type, 
+                None if clusters is None else clusters[subset], df_absorbed)
+            for y, r in zip([outcomes[i] for i in pattern], results):
+                self._fill(
+                    store, X, r.params, r.bse, r.tvalues, r.pvalues, y)
+                    
+    # Generate rows of logit or probit statistics cells for every value of a
+    # grouping
+    # every value is fit at once, starting from the parameters of the 
+    # pooled fit
+    def _generate_binary(self, grouping):
+        X = self._exog()
+        cols = grouping._df._columns(X)
+        codes = grouping._codes
+        complete = (codes >= 0) & self._complete(cols)
+        exog = np.column_stack([cols[v] for v in X]).astype(float)
+        
+        store = self._cells[grouping._group]
+        for y in self._outcomes():
+            endog = grouping._df._columns([y])[y].astype(float)
+            subset = complete & ~np.isnan(endog)
+            r = binary.grouped_binary(
+                endog[subset], exog[subset], codes[subset], len(store), 
+                self._model, self._pooled_start(y))
+            self._fill(
+                store, X, r.params, r.bse, r.tvalues, r.pvalues, y, 
+                r.converged)
+                
+    # Generate rows of OLS statistics cells for every value of a grouping 
+    # from chunks of rows
+    # only one chunk of the regression variables is in memory at a time; 
+    # the fits of every dependent variable are accumulated in a single pass
+    # over the chunks, one pass for every grouping of every table
+    def _generate_streaming(self, grouping):
+        store = self._cells[grouping._group]
+        X, outcomes = self._exog(), self._outcomes()
+        codes = grouping._codes
+        if self._table._rows is not None:
+            codes = np.full(len(self._table._source_df), -1)
+            codes[self._table._rows] = grouping._codes
+        fits = [streaming.StreamingOLS(
+            y, X, cov_type=self._cov_type, cov_kwds=self._cov_kwds) 
+            for y in outcomes]
+        start = 0
+        for chunk in self._chunks:
+            stop = start + len(chunk)
+            if stop > len(codes):
+                break
+            [fit.update(chunk, codes[start:stop]) for fit in fits]
+            start = stop
+        if start != len(codes):
+            raise ValueError(
+                'Chunks do not have the rows of the DataFrame')
+        
+        for y, fit in zip(outcomes, fits):
+            values, r = fit.results()
+            results = []
+            for a in [r.params, r.bse, r.tvalues, r.pvalues]:
+                results.append(np.full((len(store), len(X)), np.nan))
+                results[-1][values] = a
+            self._fill(store, X, *results, y)
+                
+    # Get the parameters of the pooled logit or probit fit of a dependent
+    # variable on the table's DataFrame, the starting values of fits by 
+    # vertical group
+    # return: [parameter] (None if the pooled fit did not converge)
+    def _pooled_start(self, y):
+        if y not in self._start:
+            X = self._exog()
+            cols = self._table._df._columns([y] + X)
+            complete = self._complete(cols)
+            exog = np.column_stack([cols[v] for v in X])[complete]
+            results = binary.fit(
+                cols[y][complete].astype(float), exog.astype(float), 
+                self._model)
+            self._start[y] = results.params if results.converged else None
+        return self._start[y]
+        
+    # Indicates the covariance type is supported by the binary response 
+    # estimators
+    def _binary_cov(self):
+        return self._cov_type == 'nonrobust' and not self._cov_kwds
+                
+    # Group dependent variables by their pattern of missing rows
+    # missing: 2-D boolean numpy array, column i indicates the missing rows 
+    #   of dependent variable i
+    # return: [[index of dependent variable] for each missing pattern]
+    def _missing_patterns(self, missing):
+        patterns = {}
+        packed = np.packbits(missing, axis=0)
+        for i in range(missing.shape[1]):
+            patterns.setdefault(packed[:,i].tobytes(), []).append(i)
+        return list(patterns.values())
+                
+    # Indicates the covariance type and keywords are supported by grouped 
+    # OLS (and by absorbed fixed effects, if specified)
+    def _grouped_cov(self):
+        if self._absorb and self._cov_type not in ABSORB_COV_TYPES:
+            return False
+        if self._cov_type == 'cluster':
+            return list(self._cov_kwds) == ['groups']
+        return self._cov_type in ols.COV_TYPES and not self._cov_kwds
             
+    # Fill the cells of a grouping with results
+    # arguments:
+    #   store: CellStore of the grouping
+    #   X: [exogenous variable]
+    #   params, bse, tvalues, pvalues: 2-D numpy arrays of results 
+    #     (row x exogenous variable)
+    #   y: dependent variable of the results
+    #   converged: indicator that the fit of each row converged (None for 
+    #     OLS)
+    #   rows: row positions of the results in the store (None: every row)
+    def _fill(
+            self, store, X, params, bse, tvalues, pvalues, y, 
+            converged=None, rows=None):
+        for v in self._regressors:
+            i, col = X.index(v), v if type(self._y) != list else (y, v)
+            store.set('param', col, params[:,i], rows)
+            store.set('bse', col, bse[:,i], rows)
+            store.set('tvalue', col, tvalues[:,i], rows)
+            store.set('pvalue', col, pvalues[:,i], rows)
+            if converged is not None:
+                store.set('converged', col, converged, rows)
+        
+    # Get exogenous variables: regressors, controls and constant
+    # the constant is absorbed by fixed effects
+    def _exog(self):
         X = self._regressors + self._controls
+        if self._absorb:
+            if '_const' in X:
+                raise ValueError(
+                    'Constant cannot be estimated with absorbed fixed '
+                    'effects')
+            return X
         if self._const and '_const' not in X:
             X.append('_const')
+        return X
+        
+    # Get indicator of rows with no missing values
+    # cols: {var: numpy array}
+    def _complete(self, cols):
+        return ~np.any([pd.isna(c) for c in cols.values()], axis=0)
+        
+    # Generates analysis results of a dependent variable
+    # only the columns used in the regression are read, as read-only views
+    # of the vertical group DataFrame, df
+    # rows with missing values are dropped
+    # the numpy engine fits covariance types it supports by the minimal 
+    # estimators, others are fit by statsmodels
+    # logit and probit fits start from the parameters of the pooled fit
+    # results of a value with no complete rows are missing
+    # return: ([exogenous variable], results, converged (None for OLS))
+    def _generate_results(self, y, df):
+        X = self._exog()
+        groups = self._cov_kwds.get('groups')
+        
+        vars = [y] + X + [groups]*(groups is not None)
+        cols = df._columns(vars)
+        complete = self._complete(cols)
+        if not complete.any():
+            return (X, ols.missing_results(len(X)), None)
+        if not complete.all():
+            cols = {v: c[complete] for v, c in cols.items()}
             
-        if 'groups' in self._cov_kwds:
-            cov_kwds = {'groups': df[self._cov_kwds['groups']].data}
-            
-        return sm.OLS(df[self._y].data, df[X].data).fit(
+        cov_kwds = dict(self._cov_kwds)
+        if groups is not None:
+            cov_kwds['groups'] = cols[groups]
+        exog = np.column_stack([cols[v] for v in X])
+        if self._model != 'ols':
+            return self._generate_binary_results(y, X, cols, exog, cov_kwds)
+        if self._engine == 'numpy' and self._grouped_cov():
+            clusters = None
+            if groups is not None:
+                clusters = pd.factorize(cols[groups])[0]
+            return (X, ols.fit(
+                cols[y].astype(float), exog.astype(float), 
+                self._cov_type, clusters), None)
+        results = sm.OLS(cols[y], exog).fit(
             cov_type=self._cov_type, cov_kwds=cov_kwds)
+        return (X, results, None)
+        
+    # Generates logit or probit results of a dependent variable
+    # statsmodels is given a covariance type only if it is robust
+    # arguments: see _generate_results, cols and exog of complete rows
+    # return: see _generate_results
+    def _generate_binary_results(self, y, X, cols, exog, cov_kwds):
+        start = self._pooled_start(y)
+        if self._engine != 'statsmodels' and self._binary_cov():
+            results = binary.fit(
+                cols[y].astype(float), exog.astype(float), self._model, 
+                start)
+            return (X, results, results.converged)
+        model = sm.Logit if self._model == 'logit' else sm.Probit
+        cov = {}
+        if self._cov_type != 'nonrobust':
+            cov = {'cov_type': self._cov_type, 'cov_kwds': cov_kwds}
+        results = model(cols[y], exog).fit(start_params=start, disp=0, **cov)
+        return (X, results, results.mle_retvals['converged'])
     
     
     
@@ -143,8 +512,10 @@ class Analysis(BlockBase):
     # does not assign to parent Table or copy cells
     def __deepcopy__(self, memo):
         return Analysis(
-            y=self._y, 
+            y=deepcopy(self._y), 
             regressors=deepcopy(self._regressors), 
             controls=deepcopy(self._controls),
             cov_type=self._cov_type, cov_kwds=deepcopy(self._cov_kwds), 
-            const=self._const, title=self._title)
\ No newline at end of file
+            const=self._const, title=self._title, 
+            absorb=deepcopy(self._absorb), engine=self._engine, 
+            model=self._model, chunks=self._chunks)
\ No newline at end of file
@@ -0,0 +1,292 @@
+##############################################################################
+# Output Backends
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+from html import escape
+import xlsxwriter
+
+# Output formats, and the extension of the file each writes
+FORMATS = {
+    'xlsx': '.xlsx', 'csv': '.csv', 'parquet': '.parquet',
+    'json': '.jsonl', 'html': '.html', 'latex': '.tex'}
+
+# Open the backend of an output format
+# arguments:
+#   format: output format (see FORMATS)
+#   file_name: name of the output file, without extension
+#   streaming: indicator to write xlsx in constant memory mode
+# return: Backend
+def open_backend(format, file_name, streaming=False):
+    if format not in FORMATS:
+        raise ValueError('Unsupported output format: '+str(format))
+    file_name += FORMATS[format]
+    if format == 'xlsx':
+        return XlsxBackend(file_name, streaming)
+    return {
+        'csv': CsvBackend, 'parquet': ParquetBackend, 'json': JsonBackend,
+        'html': HtmlBackend, 'latex': LatexBackend}[format](file_name)
+
+
+
+'''
+Writes generated tables to an output file, one table at a time, as they
+are generated
+Backends implement write_table and close
+'''
+class Backend():
+    # Write a generated table
+    def write_table(self, table):
+        raise NotImplementedError
+
+    # Finish writing the output file
+    def close(self):
+        raise NotImplementedError
+
+
+
+##############################################################################
+# Excel
+##############################################################################
+
+'''
+Writes tables to worksheets of an xlsx workbook
+Data:
+    wb: xlsxwriter Workbook
+    format: {format name: xlsxwriter Format}
+    worksheets: {ws title: [Worksheet, current row]}
+'''
+class XlsxBackend(Backend):
+    # Initialize a new workbook
+    # initialize workbook
+    # add formats
+    # streaming: indicator to open the workbook in constant memory mode, in
+    #   which rows are flushed to disk as they are completed
+    def __init__(self, file_name, streaming=False):
+        self._wb = xlsxwriter.Workbook(
+            file_name, {'constant_memory': streaming})
+        self._worksheets = {}
+
+        self._format = {}
+        self._format['default'] = self._wb.add_format()
+        self._format['bold'] = self._wb.add_format({'bold': True})
+        self._format['center'] = self._wb.add_format({'center_across': True})
+        self._format['center_bold'] = self._wb.add_format(
+            {'center_across': True, 'bold': True})
+        for format in self._format.values():
+            format.set_text_wrap(True)
+            format.set_align('vcenter')
+
+    # Write a single table to the workbook
+    # if table belongs to new worksheet, initialize worksheet
+    # write table to worksheet (in row order, as required in streaming mode)
+    def write_table(self, table):
+        ws_title = table._ws_title
+        if ws_title not in self._worksheets:
+            ws = self._wb.add_worksheet(ws_title)
+            ws.set_column(0, 99, width=20)
+            self._worksheets[ws_title] = [ws, 0]
+
+        self._worksheets[ws_title][1] = table._write(
+            *self._worksheets[ws_title], self._format) - 1
+
+    def close(self):
+        self._wb.close()
+
+
+
+##############################################################################
+# Records (machine-readable)
+##############################################################################
+
+'''
+Writes the cells of tables as records of numeric estimates, one record per
+statistic (see Table._records)
+records of all tables are appended to a single file
+Data:
+    file: output file
+    header: indicator that no records have been written yet
+'''
+class CsvBackend(Backend):
+    def __init__(self, file_name):
+        self._file = open(file_name, 'w', newline='')
+        self._header = True
+
+    def write_table(self, table):
+        table._records().to_csv(self._file, header=self._header, index=False)
+        self._header = False
+
+    def close(self):
+        self._file.close()
+
+'''
+Writes records as JSON lines, one record per line
+Data:
+    file: output file
+'''
+class JsonBackend(Backend):
+    def __init__(self, file_name):
+        self._file = open(file_name, 'w')
+
+    def write_table(self, table):
+        records = table._records()
+        if len(records):
+            lines = records.to_json(
+                orient='records', lines=True, double_precision=15)
+            self._file.write(lines if lines.endswith('\n') else lines+'\n')
+
+    def close(self):
+        self._file.close()
+
+'''
+Writes records to a Parquet file, one row group per table
+requires pyarrow
+Data:
+    writer: pyarrow ParquetWriter
+    schema: pyarrow schema of the records
+'''
+class ParquetBackend(Backend):
+    def __init__(self, file_name):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("format='parquet' requires pyarrow")
+        self._pa = pa
+        self._schema = pa.schema(
+            [(col, pa.string()) for col in [
+                'worksheet', 'title', 'subtitle', 'block', 'vgroup',
+                'value', 'y', 'var', 'statistic', 'key']]
+            + [('estimate', pa.float64())])
+        self._writer = pq.ParquetWriter(file_name, self._schema)
+
+    def write_table(self, table):
+        records = table._records()
+        for col in ['y', 'var']:
+            records[col] = [
+                None if v is None else str(v) for v in records[col]]
+        self._writer.write_table(self._pa.Table.from_pandas(
+            records, schema=self._schema, preserve_index=False))
+
+    def close(self):
+        self._writer.close()
+
+
+
+##############################################################################
+# Documents
+##############################################################################
+
+'''
+Writes the layout of every table as an HTML table, under a heading for
+each worksheet
+Data:
+    file: output file
+    ws_title: title of the current worksheet
+'''
+class HtmlBackend(Backend):
+    # Tag and class of each format
+    TAGS = {
+        'default': ('td', None), 'bold': ('th', None),
+        'center': ('td', 'center'), 'center_bold': ('th', 'center')}
+
+    def __init__(self, file_name):
+        self._file = open(file_name, 'w')
+        self._ws_title = None
+        self._file.write(
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            '<style>\ntable {border-collapse: collapse; margin: 1em 0;}\n'
+            'td, th {padding: 0.25em 0.75em; vertical-align: middle;}\n'
+            '.center {text-align: center;}\n</style>\n</head>\n<body>\n')
+
+    def write_table(self, table):
+        if table._ws_title != self._ws_title:
+            self._ws_title = table._ws_title
+            self._file.write('<h2>{}</h2>\n'.format(escape(self._ws_title)))
+        layout = table._lay_out(0)
+        ncols = layout.ncols()
+        self._file.write('<table>\n')
+        for row, cells in layout.rows():
+            self._file.write('<tr>')
+            col = 0
+            for cell_col, value, format, merge in cells:
+                self._file.write('<td></td>' * (cell_col-col))
+                tag, cls = self.TAGS[format]
+                span = 1 if merge is None else merge[1]-cell_col+1
+                self._file.write('<{}{}{}>{}</{}>'.format(
+                    tag, '' if cls is None else ' class="{}"'.format(cls),
+                    '' if span == 1 else ' colspan="{}"'.format(span),
+                    '<br>'.join(escape(line.strip())
+                        for line in value.strip().split('\n')),
+                    tag))
+                col = cell_col + span
+            self._file.write('<td></td>' * (ncols-col) + '</tr>\n')
+        self._file.write('</table>\n')
+
+    def close(self):
+        self._file.write('</body>\n</html>\n')
+        self._file.close()
+
+'''
+Writes the layout of every table as a LaTeX tabular in a standalone
+document, under a section for each worksheet
+multi-line cells are set in nested tabulars, so that no packages are needed
+Data:
+    file: output file
+    ws_title: title of the current worksheet
+'''
+class LatexBackend(Backend):
+    # Special characters and their escapes
+    ESCAPES = {
+        '\\': r'\textbackslash{}', '&': r'\&', '%': r'\%', '$': r'\$',
+        '#': r'\#', '_': r'\_', '{': r'\{', '}': r'\}',
+        '~': r'\textasciitilde{}', '^': r'\textasciicircum{}'}
+
+    def __init__(self, file_name):
+        self._file = open(file_name, 'w')
+        self._ws_title = None
+        self._file.write(
+            '\\documentclass{article}\n\\begin{document}\n')
+
+    def write_table(self, table):
+        if table._ws_title != self._ws_title:
+            self._ws_title = table._ws_title
+            self._file.write(
+                '\\section*{{{}}}\n'.format(self._escape(self._ws_title)))
+        layout = table._lay_out(0)
+        ncols = layout.ncols()
+        self._file.write(
+            '\\begin{{tabular}}{{l{}}}\n'.format('c' * (ncols-1)))
+        for row, cells in layout.rows():
+            entries, col = [], 0
+            for cell_col, value, format, merge in cells:
+                entries.extend([''] * (cell_col-col))
+                span = 1 if merge is None else merge[1]-cell_col+1
+                text = self._cell(value, format)
+                if span > 1:
+                    text = '\\multicolumn{{{}}}{{c}}{{{}}}'.format(span, text)
+                entries.append(text)
+                col = cell_col + span
+            entries.extend([''] * (ncols-col))
+            self._file.write(' & '.join(entries) + ' \\\\\n')
+        self._file.write('\\end{tabular}\n\\bigskip\n\n')
+
+    # Typeset the value of a cell
+    def _cell(self, value, format):
+        lines = [
+            self._escape(line.strip()) for line in value.strip().split('\n')]
+        if format in ['bold', 'center_bold']:
+            lines = ['\\textbf{{{}}}'.format(line) for line in lines]
+        if len(lines) == 1:
+            return lines[0]
+        return '\\begin{{tabular}}{{@{{}}c@{{}}}}{}\\end{{tabular}}'.format(
+            ' \\\\ '.join(lines))
+
+    # Escape special characters
+    def _escape(self, text):
+        return ''.join(self.ESCAPES.get(c, c) for c in text)
+
+    def close(self):
+        self._file.write('\\end{document}\n')
+        self._file.close()
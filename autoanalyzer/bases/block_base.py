@@ -7,8 +7,10 @@
 from autoanalyzer.data_frame import DataFrame
 from autoanalyzer.cells.summary_cell import SummaryCell
 from autoanalyzer.cells.analysis_cell import AnalysisCell
-from autoanalyzer.bases.writer_base import WriterBase, POOLED_VAL
+from autoanalyzer.cells.cell_store import CellStore
+from autoanalyzer.bases.writer_base import WriterBase
 from autoanalyzer.bases.base import Base
+import numpy as np
 
 class BlockBase(WriterBase, Base):
     # Initialize block
@@ -16,6 +18,7 @@ class BlockBase(WriterBase, Base):
         self.table(table)
         self.title(title)
         self._cells = {}
+        self._timings = {}
 
     # Set the parent Table or TableGenerator
     def table(self, table=None):
@@ -26,24 +29,75 @@ class BlockBase(WriterBase, Base):
     def get_table(self):
         return self._table
         
-    # Initialize row of cells
-    # type: type of block
-    # cells: {vgroup: {vgroup_val: {var: SummaryCell}}}
-    # row: row of cells belonging to a particular vgroup value
-    def _init_row(self, type):
-        vgroup = self._table._vgroup
-        val = self._table._vgroup_val
+    # Get generation time of the block
+    # return: {vgroup: seconds}
+    def get_timings(self):
+        return dict(self._timings)
         
-        if vgroup not in self._cells:
-            self._cells[vgroup] = {}
-            
+    # Initialize the cells of every value of a vertical group variable
+    # arguments:
+    #   type: type of block
+    #   vgroup: vertical group variable
+    #   vals: [vertical group value]
+    # cells: {vgroup: CellStore}
+    # each vgroup has its own store, so that the cells of different 
+    # groupings can be generated concurrently
+    # return: CellStore
+    def _init_cells(self, type, vgroup, vals):
         if type == 'summary':
-            self._cells[vgroup][val] = {v: SummaryCell() for v in self._vars}
+            store = CellStore(SummaryCell, vals, self._vars)
         elif type == 'analysis':
-            self._cells[vgroup][val] = {v: AnalysisCell() 
-                for v in self._regressors}
-                
-        self._row = self._cells[vgroup][val]
+            store = CellStore(AnalysisCell, vals, self._col_vars())
+        self._cells[vgroup] = store
+        return store
+        
+    # Generate rows of cells for every value of a grouping
+    # by default, generate each row from the DataFrame of its value
+    # (the DataFrame of each value is taken from row positions found by a 
+    # single sort, rather than by comparing every row to every value)
+    # the cells of the grouping must already be initialized
+    def _generate_grouping(self, grouping):
+        for val, df in grouping.frames():
+            self._generate_frame(df, grouping._group, val)
+        
+        
+        
+    # Get the cells of the block as records
+    # arguments:
+    #   vgroups: [vertical group variable] in order
+    # return: {column: numpy array}, with columns vgroup, value (as a 
+    #   string), y (dependent variable, None for summary blocks), var 
+    #   (column variable) and the statistic, key and estimate columns of 
+    #   CellStore.records
+    def _records(self, vgroups):
+        columns = ['vgroup', 'value', 'y', 'var', 'statistic', 'key', 
+            'estimate']
+        parts = {col: [] for col in columns}
+        for vgroup in vgroups:
+            store = self._cells[vgroup]
+            records = store.records()
+            parts['vgroup'].append(
+                np.full(len(records['value']), vgroup, dtype=object))
+            values = {val: str(val) for val in store._vals}
+            parts['value'].append(np.array(
+                [values[val] for val in records['value']], dtype=object))
+            names = {col: self._col_names(col) for col in store._cols}
+            parts['y'].append(np.array(
+                [names[col][0] for col in records['col']], dtype=object))
+            parts['var'].append(np.array(
+                [names[col][1] for col in records['col']], dtype=object))
+            [parts[col].append(records[col]) 
+                for col in ['statistic', 'key', 'estimate']]
+        return {col: np.concatenate(parts[col]) for col in columns}
+        
+    # Get the dependent variable and variable of a column variable
+    # return: (dependent variable (None for summary blocks), variable)
+    def _col_names(self, col_var):
+        return (None, col_var)
+        
+    # Remove references to data from a generated block
+    def _strip(self):
+        self.__dict__.pop('_df', None)
         
         
         
@@ -51,34 +105,28 @@ class BlockBase(WriterBase, Base):
     # Write
     ##########################################################################
     
-    # Write
+    # Write to the table's layout
     # collect arguments and set column variables
     # write title
     # write heading
-    # write data (cells)
+    # write data (cells), row by row
     def _write_block(self, row, col, type):
         self._collect_write_args(row, col)
         if type == 'summary':
             self._cols = self._vars
         elif type == 'analysis':
-            self._cols = self._regressors
+            self._cols = self._col_vars()
             
         self._write_block_title()
-        vgroups = self._table._vgroups
-        vgroups['Pooled'] = [POOLED_VAL]
-        
-        [self._write_cell(vgroup, val, var) 
-            for vgroup in vgroups for val in vgroups[vgroup]
-            for var in self._cols]
+        [self._write_row(vgroup, val, row) 
+            for vgroup, val, row in self._table._vgroup_rows]
             
     # Collect arguments for writing the block
     def _collect_write_args(self, row, col):
         self._row_num = row
         self._col_num = col
         self._df = self._table._df
-        self._ws = self._table._ws
-        self._format = self._table._format
-        self._vgroup_index = self._table._vgroup_index
+        self._layout = self._table._layout
         
     # Write the block title
     def _write_block_title(self):
@@ -87,20 +135,23 @@ class BlockBase(WriterBase, Base):
         end_col = start_col + self.ncols()-1
         self._write_title(
             row, start_col, row, end_col, 
-            self._title, self._format['center_bold'])
-        [self._ws.write(
-            row+1, start_col+i, 
-            self._df._vars[v]['label'], self._format['center_bold'])
+            self._title, 'center_bold')
+        [self._layout.write(
+            row+1, start_col+i, self._col_label(v), 'center_bold')
             for i,v in enumerate(self._cols)]
+            
+    # Get the column heading of a column variable
+    def _col_label(self, col_var):
+        return self._df._vars[col_var]['label']
         
-    # Write a single cell
+    # Write the cells of a single row
     # arguments:
     #   vgroup: verticle group variables
-    #   val: value of the vertical group variable for this cell
-    #   col_var: column variable for this cell
-    def _write_cell(self, vgroup, val, col_var):
-        row = self._vgroup_index[vgroup][val]
-        col = self._col_num + self._cols.index(col_var)
-        self._cells[vgroup][val][col_var]._write(
-            self._ws, row, col, self._format['center'])
+    #   val: value of the vertical group variable for this row
+    #   row: row number
+    def _write_row(self, vgroup, val, row):
+        store = self._cells[vgroup]
+        [self._layout.write(
+            row, self._col_num+i, store.cell(val, col_var)._text(), 'center')
+            for i, col_var in enumerate(self._cols)]
       
\ No newline at end of file
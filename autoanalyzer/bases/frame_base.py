@@ -4,25 +4,65 @@
 # last modified 05/23/2019
 ##############################################################################
 
+from pandas.api.types import is_numeric_dtype, is_complex_dtype, is_hashable
 import pandas as pd
-from copy import deepcopy
+import numpy as np
+import inspect
+
+# Variables with fewer distinct values than this are inferred as ordered
+MAX_ORDERED_VALS = 10
+
+# Default seed of the random sample of rows from which types are inferred,
+# so that the same data are always given the same types
+SAMPLE_SEED = 0
+
+# pandas special methods which are not forwarded
+# (object model, attribute access and pickling)
+NOT_FORWARDED = [
+    '__class__', '__dict__', '__doc__', '__module__', '__weakref__',
+    '__init__', '__new__', '__init_subclass__', '__subclasshook__',
+    '__class_getitem__', '__getattr__', '__getattribute__', '__setattr__', 
+    '__delattr__', '__getstate__', '__setstate__', '__reduce__', 
+    '__reduce_ex__']
+
+# {pandas type: autoanalyzer type}
+WRAPPERS = {}
 
 class FrameBase():
+    # pandas type wrapped by the subclass (pd.DataFrame or pd.Series)
+    _pandas_type = None
+    
+    # Register a subclass as the wrapper for its pandas type
+    # special methods are looked up on the class rather than the instance,
+    # and setting a property (e.g. columns) must not set an instance 
+    # attribute, so both are forwarded here; pandas methods are forwarded
+    # lazily in __getattr__
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        WRAPPERS[cls._pandas_type] = cls
+        for name in dir(cls._pandas_type):
+            if name in FrameBase.__dict__ or name in cls.__dict__:
+                continue
+            if name.startswith('__'):
+                if (name not in NOT_FORWARDED 
+                        and callable(getattr(cls._pandas_type, name))):
+                    setattr(cls, name, _method(cls._pandas_type, name))
+            elif not name.startswith('_'):
+                forwarder = _forwarder(cls._pandas_type, name)
+                if isinstance(forwarder, property):
+                    setattr(cls, name, forwarder)
+
     # Initialize DataFrame or Series
     # convert args and kwargs to pandas DataFrame and Series
     # initialize empty variable decoration dictionary
     # set data to pandas DataFrame or Series
     def __init__(self, *args, **kwargs):
-        from autoanalyzer.data_frame import DataFrame
-        from autoanalyzer.series import Series
-        
         self._vars = dict()
+        self._decorated = False
+        self._clear_cache()
         args = self._to_pandas(list(args), self._vars)
         kwargs = self._to_pandas(dict(kwargs), self._vars)
-        if type(self) == DataFrame:
-            self.data = pd.DataFrame(*args, **kwargs)
-        elif type(self) == Series:
-            self.data = pd.Series(*args, **kwargs)
+        self.data = self._pandas_type(*args, **kwargs)
     
     
     
@@ -31,19 +71,31 @@ class FrameBase():
     ##########################################################################
     
     # Automatically decorate the dataframe
-    def decorate(self, vars=None):
+    # sample and max_rows bound the number of rows scanned to infer types,
+    # which are sampled with seed (see infer_types)
+    # decoration of all variables is cached: it is shared with DataFrames 
+    # derived by selecting rows, and is only recomputed after a column is
+    # set (see __setitem__) or decoration is cleared
+    def decorate(
+            self, vars=None, sample=None, max_rows=None, seed=SAMPLE_SEED):
+        if vars is None and self._decorated:
+            return
         self.infer_labels(vars)
-        self.infer_types(vars)
+        self.infer_types(vars, sample, max_rows, seed)
         self.infer_group_pctiles(vars)
         self.infer_cell_pctiles(vars)
+        if vars is None:
+            self._decorated = True
         
     # Clear decoration
     def clear_decoration(self, vars=None):
+        self._decorated = False
         if vars is None:
             self._vars = {}
             return
+        self._vars = dict(self._vars)
         for v in vars:
-            self.vars[v] = {}
+            self._vars[v] = {}
     
     
     ##########################################################################
@@ -53,10 +105,7 @@ class FrameBase():
     # Set variable labels
     # labels: {var: label}
     def labels(self, labels):
-        for var, label in labels.items():
-            if var not in self._vars:
-                self._vars[var] = {}
-            self._vars[var]['label'] = label
+        self._set_attr('label', labels)
         
     # Infer the labels of a (list of) variable(s)
     # i.e. set label to variable name
@@ -86,47 +135,110 @@ class FrameBase():
     # Set variable types
     # types: {var: type}
     # type is unary, binary, ordered, numeric, or category
+    # set types are kept when their variables are overwritten (see 
+    # __setitem__), unlike inferred types
     def types(self, types):
-        for var, t in types.items():
-            if var not in self._vars:
-                self._vars[var] = {}
-            self._vars[var]['type'] = t
+        self._set_attr('type', types)
+        self._set_attr('inferred', {v: False for v in types})
         
     # Infer the types (category, ordered, numeric) of a (list of) variable(s)
     # vars: variable name (string) or list of variable names or None
+    # sample: number of randomly sampled rows from which to infer types
+    #   (None to use all rows)
+    # max_rows: maximum number of rows used for variables whose type cannot 
+    #   be decided from the sample (None to use all rows)
+    # seed: seed of the random samples (None for a different sample every
+    #   call)
     # Note: variables with numeric data are inferred as ordered if the number
     # of distinct values is fewer than 10, otherwise it is inferred as numeric
     # this inference will not always be correct
-    def infer_types(self, vars=None):
+    # Note: a type is decided from the sample if more rows cannot change it,
+    # i.e. the sample contains a non-numeric value (category) or a numeric 
+    # variable has at least 10 distinct values in the sample (numeric)
+    def infer_types(
+            self, vars=None, sample=None, max_rows=None, seed=SAMPLE_SEED):
         if vars is None:
             vars = self._undecorated_vars('type')
         if type(vars) == str:
             vars = [vars]
-        types = {}
+            
+        rng = np.random.default_rng(seed)
+        sample_rows = self._sample_rows(sample, rng)
+        types, sampled, ambiguous = {}, {}, []
         for var in vars:
-            values = set(self[var].dropna())
+            series = self.data[var]
+            if sample_rows is None:
+                types[var] = self._infer_type(series)
+                sampled[var] = False
+                continue
+            t = self._infer_type(series.take(sample_rows))
+            if (t == 'category' 
+                    or (t == 'numeric' and is_numeric_dtype(series))):
+                types[var], sampled[var] = t, True
+            else:
+                ambiguous.append(var)
+                
+        max_rows = self._sample_rows(max_rows, rng)
+        for var in ambiguous:
+            series = self.data[var]
+            if max_rows is not None:
+                series = series.take(max_rows)
+            types[var] = self._infer_type(series)
+            sampled[var] = max_rows is not None
+        self._set_attr('type', types)
+        self._set_attr('inferred', {v: True for v in types})
+        self._set_attr('sampled', sampled)
+        
+    # Return sorted positions of a uniform random sample of rows
+    # equivalent to a reservoir sample over the rows
+    # rng: numpy random Generator
+    # return None if the sample would include every row
+    def _sample_rows(self, size, rng):
+        if size is None or size >= len(self.data):
+            return None
+        rows = rng.choice(
+            len(self.data), size, replace=False, shuffle=False)
+        rows.sort()
+        return rows
+        
+    # Infer the type of a pandas Series
+    # numeric dtypes: count distinct values, stopping early at 10
+    # other dtypes: category unless every distinct value converts to float
+    def _infer_type(self, series):
+        if is_numeric_dtype(series) and not is_complex_dtype(series):
+            num_vals = _count_distinct(series, MAX_ORDERED_VALS)
+        else:
+            values = series.dropna().drop_duplicates().astype(object).values
             try:
-                num_vals = len([float(i) for i in values])
-                if num_vals == 1:
-                    types[var] = 'unary'
-                elif num_vals == 2:
-                    types[var] = 'binary'
-                elif num_vals < 10:
-                    types[var] = 'ordered'
-                else:
-                    types[var] = 'numeric'
-            except:
-                types[var] = 'category'
-        self.types(types)
+                values.astype(float)
+            except (TypeError, ValueError):
+                return 'category'
+            num_vals = len(values)
+            
+        if num_vals == 1:
+            return 'unary'
+        if num_vals == 2:
+            return 'binary'
+        if num_vals < MAX_ORDERED_VALS:
+            return 'ordered'
+        return 'numeric'
         
     # Get types
     # return: {var: type}
     def get_types(self):
         return self._decorated_vars('type')
         
+    # Get variables whose types were inferred from a sample of rows
+    # return: [var]
+    def get_sampled_types(self):
+        return [v for v, sampled in self._decorated_vars('sampled').items()
+            if sampled]
+        
     # Clear types
     def clear_types(self):
         self._clear_attr('type')
+        self._clear_attr('sampled')
+        self._clear_attr('inferred')
     
     
     
@@ -175,16 +287,27 @@ class FrameBase():
         self._clear_attr('cell_pctile')
     
     
+    # Get bins of a numeric variable for grouping
+    # quantile bin edges are computed once for the variable's group 
+    # percentiles from the rows of this DataFrame, and cached on it (see 
+    # _clear_cache), so frames derived from it compute their own bins
+    # return: (numpy array of bin edges, [bin Interval])
+    def _get_group_bins(self, var):
+        pctiles = self._vars[var]['group_pctile']
+        bins = self._group_bins.get(var)
+        if bins is None or bins[0] != pctiles:
+            cut, edges = pd.qcut(self.data[var], pctiles, retbins=True)
+            bins = (list(pctiles), edges, list(cut.cat.categories))
+            self._group_bins[var] = bins
+        return (bins[1], bins[2])
+    
     # Set percentiles
     # group_pctiles: indicates whether these are group or cell percentiles
     def _set_pctiles(self, pctiles, group_pctiles):
-        for var, pctile in pctiles.items():
-            if var not in self._vars:
-                self._vars[var] = {}
-            if group_pctiles:
-                self._vars[var]['group_pctile'] = pctile
-            else:
-                self._vars[var]['cell_pctile'] = pctile
+        if group_pctiles:
+            self._set_attr('group_pctile', pctiles)
+        else:
+            self._set_attr('cell_pctile', pctiles)
             
     # Infer percentiles
     # vars: variable name (string) or list of variable names or None
@@ -220,8 +343,54 @@ class FrameBase():
             
     # Clear decoration for an attribute
     def _clear_attr(self, attr):
-        for v in self._decorated_vars(attr):
-            self._vars[v][attr] = None
+        self._decorated = False
+        self._set_attr(attr, {v: None for v in self._decorated_vars(attr)})
+        
+    # Set decoration attribute (attr) for variables
+    # values: {var: value}
+    # variable records are shared between a frame and the frames derived 
+    # from it, so they are never modified in place (copy on write)
+    def _set_attr(self, attr, values):
+        vars = dict(self._vars)
+        for var, value in values.items():
+            record = dict(vars.get(var, {}))
+            record[attr] = value
+            vars[var] = record
+        self._vars = vars
+            
+            
+        
+    ##########################################################################
+    # Column access
+    ##########################################################################
+    
+    # Factorize a variable into integer codes of its sorted distinct values
+    # codes are computed once and cached on the DataFrame (see _clear_cache)
+    # return: (numpy array of codes (-1 for missing), distinct values)
+    def _factorize(self, var):
+        if var not in self._factorized:
+            self._factorized[var] = pd.factorize(self.data[var], sort=True)
+        return self._factorized[var]
+        
+    # Clear the cache of factorized codes and group bins
+    # the cache is cleared when a column is set (see __setitem__) and before
+    # tables are generated; data modified in place through self.data is not
+    # seen until then
+    def _clear_cache(self):
+        self._factorized = {}
+        self._group_bins = {}
+    
+    # Get read-only numpy arrays of variables
+    # the arrays are views of the data, not copies, for variables stored in
+    # numpy arrays
+    # return: {var: numpy array}
+    def _columns(self, vars):
+        columns = {}
+        for var in vars:
+            if var not in columns:
+                columns[var] = self.data[var].to_numpy().view()
+                columns[var].flags.writeable = False
+        return columns
             
             
         
@@ -229,35 +398,65 @@ class FrameBase():
     # Operator overload
     ##########################################################################
 
+    # Forward a method of the pandas DataFrame/Series
+    # only called when normal attribute lookup fails, i.e. the first time
+    # a method of the pandas type is used; the forwarder is then cached on
+    # the class
+    # other attributes (e.g. columns) are converted from pandas and returned
+    def __getattr__(self, name):
+        if name.startswith('__') or name in ['data', '_vars']:
+            raise AttributeError(name)
+        cls = type(self)
+        try:
+            inspect.getattr_static(cls._pandas_type, name)
+        except AttributeError:
+            return self._from_pandas(getattr(self.data, name), self._vars)
+        setattr(cls, name, _forwarder(cls._pandas_type, name))
+        return getattr(self, name)
+
+    # Set a column (or columns)
+    # decoration which depends on the data of an overwritten column 
+    # (inferred types, but not set types) is cleared, and the decoration 
+    # and data caches are invalidated
+    def __setitem__(self, key, value):
+        self._overload(self._pandas_type.__setitem__, (key, value), {})
+        if type(key) != list:
+            key = [key] if is_hashable(key) else list(self._vars)
+        vars = [v for v in key if v in self._vars]
+        inferred = [v for v in vars if self._vars[v].get('inferred')]
+        [self._set_attr(attr, {v: None for v in inferred}) 
+            for attr in ['type', 'sampled', 'inferred']]
+        self._decorated = False
+        self._clear_cache()
+        
     # Generic overload operation
     # convert autoanalyzer DataFrames/Series to pandas DataFrames/Series
-    # set output by calling function on the pandas DataFrame/Series
+    # set output by calling method on the pandas DataFrame/Series
     # convert output from pandas and return
-    def _overload(self, f, *args, **kwargs):
-        vars = deepcopy(self._vars)
-        args = self._to_pandas(list(args), vars)
-        kwargs = self._to_pandas(dict(kwargs), vars)
+    # variable records are shared with the output, not copied
+    def _overload(self, method, args, kwargs):
+        other_vars = {}
+        if args:
+            args = self._to_pandas(list(args), other_vars)
+        if kwargs:
+            kwargs = self._to_pandas(kwargs, other_vars)
+        out = method(self.data, *args, **kwargs)
+        return self._from_pandas(out, self._merge_vars(other_vars))
         
-        method = getattr(self.data, f)
-        if not args and not kwargs:
-            out = method()
-        elif args and not kwargs:
-            out = method(*args)
-        elif not args and kwargs:
-            out = method(**kwargs)
-        else:
-            out = method(*args, **kwargs)
-            
-        return self._from_pandas(out, vars)
+    # Merge variable records of other DataFrames/Series with own records
+    # own records take precedence
+    def _merge_vars(self, other_vars):
+        if not other_vars:
+            return self._vars
+        vars = dict(other_vars)
+        vars.update(self._vars)
+        return vars
         
     # Convert arguments to pandas DataFrames and Series
     # if args is DataFrame/Series, update variable dictionary
     # cascade conversion over lists and dicts
     def _to_pandas(self, args, vars):
-        from autoanalyzer.data_frame import DataFrame
-        from autoanalyzer.series import Series
-    
-        if type(args) == DataFrame or type(args) == Series:
+        if isinstance(args, FrameBase):
             vars.update({v:args._vars[v] for v in args._vars
                 if v not in vars})
             return args.data
@@ -271,19 +470,82 @@ class FrameBase():
     # Convert output from pandas DataFrame and Series
     # if args is DataFrame/Series, update variables dict
     def _from_pandas(self, out, vars):
-        from autoanalyzer.data_frame import DataFrame
-        from autoanalyzer.series import Series
-        
-        if type(out) != pd.DataFrame and type(out) != pd.Series:
+        wrapper = WRAPPERS.get(type(out))
+        if wrapper is None:
             return out
             
-        if type(out) == pd.DataFrame:
-            out = DataFrame(out)
-            out._vars = {k:v for k,v in vars.items() if k in out.data}
-        elif type(out) == pd.Series:
-            out = Series(out)
-            if out.data.name in vars:
-                out._vars = {out.data.name:vars[out.data.name]}
-
+        if wrapper._pandas_type == pd.DataFrame:
+            if (vars is self._vars 
+                    and out.columns is getattr(self.data, 'columns', None)):
+                # same columns, e.g. a selection of rows
+                # share the variable dictionary and decoration cache
+                out = wrapper._wrap(out, vars)
+                out._decorated = self._decorated
+                return out
+            vars = {k:v for k,v in vars.items() if k in out}
+        elif out.name in vars:
+            vars = {out.name:vars[out.name]}
+        else:
+            vars = {}
+        return wrapper._wrap(out, vars)
+        
+    # Wrap pandas data without copying or reconstructing it
+    @classmethod
+    def _wrap(cls, data, vars):
+        out = cls.__new__(cls)
+        out._vars = vars
+        out._decorated = False
+        out._clear_cache()
+        out.data = data
         return out
-    
\ No newline at end of file
+
+
+
+##############################################################################
+# Type inference
+##############################################################################
+
+# Count the distinct non-missing values of a Series, up to (at least) cap
+# most columns with many distinct values reach cap within the first rows,
+# in which case the rest of the column is not scanned
+def _count_distinct(series, cap, head=1000):
+    num_vals = series.iloc[:head].nunique()
+    if num_vals >= cap or len(series) <= head:
+        return num_vals
+    return series.nunique()
+
+
+
+##############################################################################
+# Forwarders
+##############################################################################
+
+# Create a forwarder for an attribute of a pandas type
+# methods are forwarded as methods, other attributes as properties
+def _forwarder(pandas_type, name):
+    attr = inspect.getattr_static(pandas_type, name)
+    if isinstance(attr, (staticmethod, classmethod)) or callable(attr):
+        return _method(pandas_type, name)
+    return _property(name)
+
+# Create a method which calls a pandas method on self.data
+# plain functions are called directly, skipping attribute lookup on data
+def _method(pandas_type, name):
+    method = getattr(pandas_type, name)
+    if not inspect.isfunction(method):
+        def method(data, *args, **kwargs):
+            return getattr(data, name)(*args, **kwargs)
+        
+    def forward(self, *args, **kwargs):
+        return self._overload(method, args, kwargs)
+    forward.__name__ = name
+    return forward
+    
+# Create a property which gets and sets a pandas attribute of self.data
+def _property(name):
+    def get(self):
+        return self._from_pandas(getattr(self.data, name), self._vars)
+        
+    def set(self, value):
+        setattr(self.data, name, value)
+    return property(get, set)
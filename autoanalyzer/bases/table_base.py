@@ -6,7 +6,8 @@
 
 from autoanalyzer.data_frame import DataFrame
 from autoanalyzer.bases.base import Base
-import pandas as pd
+from autoanalyzer.grouping import GroupIndex
+import numpy as np
 
 class TableBase(Base):
     # Set writer
@@ -57,17 +58,31 @@ class TableBase(Base):
             return [groups]
         return groups
         
-    # Get a series split on group variable and values of that series
-    def _get_series_values(self, group):
-        if self._df._vars[group]['type'] == 'numeric':
-            series = pd.qcut(
-                self._df[group].data, 
-                self._df._vars[group]['group_pctile'])
-        else:
-            series = self._df[group].data
-        return (series, series.unique())
+    # Get integer codes of a group variable and sorted values of the codes
+    # numeric variables are binned at their group percentiles, using bin 
+    # edges cached on the DataFrame
+    # return: (numpy array of codes (-1 for missing), [group value])
+    def _get_group_codes(self, group):
+        if self._df._vars[group]['type'] != 'numeric':
+            codes, values = self._df._factorize(group)
+            return (codes, list(values))
+        
+        edges, labels = self._df._get_group_bins(group)
+        data = self._df.data[group].to_numpy(dtype=float, na_value=np.nan)
+        codes = np.searchsorted(edges, data, side='left') - 1
+        codes[data == edges[0]] = 0
+        codes[codes >= len(labels)] = -1
+        return (codes, labels)
+        
+    # Get a GroupIndex of the DataFrame by group variables
+    def _get_group_index(self, groups):
+        index = GroupIndex()
+        [index.add(g, *self._get_group_codes(g)) for g in groups]
+        return index
         
     # Add constant to DataFrame and decorate
+    # decoration is cached, so tables generated from subsets of a decorated
+    # DataFrame share its decoration instead of inferring it again
     def _decorate(self):
         if '_const' not in self._df:
             self._df['_const'] = 1
@@ -8,12 +8,13 @@
 POOLED_VAL = '---'
 
 class WriterBase():
-    # Write a title
+    # Write a title to the layout
+    # format: name of the title format
     def _write_title(
             self, row_start, col_start, row_end, col_end, title, format):
             
         if row_start == row_end and col_start == col_end:
-            self._ws.write(row_start, col_start, title, format)
+            self._layout.write(row_start, col_start, title, format)
             return
-        self._ws.merge_range(
+        self._layout.merge_range(
             row_start, col_start, row_end, col_end, title, format)
\ No newline at end of file
@@ -1,36 +1,60 @@
 ##############################################################################
 # Analysis Cell
 # by Dillon Bowen
-# last modified 05/23/2019
+# last modified 10/17/2026
 ##############################################################################
 
 '''
+View of an analysis statistics cell of a CellStore
 Data:
+    store: CellStore
+    i, j: row and column of the cell in the store
+Fields:
     param: [parameter mean]
     bse: [parameter standard error]
     tvalue: [t value for parameter == 0]
     pvalue: [p value for parameter == 0]
+    converged: [indicator that the fit converged] (None if not iterative)
 '''
 class AnalysisCell():
-    _param = None
-    _bse = None
-    _tvalue = None
-    _pvalue = None
+    FIELDS = {
+        'param': float, 'bse': float, 'tvalue': float, 'pvalue': float, 
+        'converged': bool}
+    RAGGED = []
+    __slots__ = ['_store', '_i', '_j']
     
+    def __init__(self, store, i, j):
+        self._store, self._i, self._j = store, i, j
+        
     def param(self, param):
-        self._param = param
+        self._set('param', param)
         
     def bse(self, bse):
-        self._bse = bse
+        self._set('bse', bse)
         
     def tvalue(self, tvalue):
-        self._tvalue = tvalue
+        self._set('tvalue', tvalue)
         
     def pvalue(self, pvalue):
-        self._pvalue = pvalue
+        self._set('pvalue', pvalue)
+        
+    def converged(self, converged):
+        self._set('converged', converged)
+        
+    # Set a field of the cell
+    def _set(self, field, value):
+        self._store.set(
+            field, self._store._cols[self._j], value, [self._i])
+            
+    # Get a field of the cell (None if not set)
+    def _get(self, field):
+        return self._store.get(field, self._i, self._j)
         
-    def _write(self, ws, row, col, format):
+    def _text(self):
         text = '{:.3f} \n ({:.3f}) \n t = {:.2f}, p = {:.3f}'.format(
-            self._param, self._bse, self._tvalue, self._pvalue)
-        ws.write(row, col, text, format)
+            *[self._get(f) for f in ['param','bse','tvalue','pvalue']])
+        converged = self._get('converged')
+        if converged is not None and not converged:
+            text += ' \n (not converged)'
+        return text
         
\ No newline at end of file
@@ -0,0 +1,177 @@
+##############################################################################
+# Cell Store
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+import numpy as np
+
+'''
+Columnar store of the cells of a block for every value of a vertical group
+variable
+scalar statistics are kept in 2-D numpy arrays indexed by (value, column
+variable), and lists of pairs (e.g. frequencies) in ragged arrays, the
+pairs of every cell concatenated, with the start and stop of each cell
+cell objects (SummaryCell, AnalysisCell) are views of a single cell
+Data:
+    cell_type: class of cell views, whose FIELDS are {scalar field: dtype}
+        and RAGGED are [ragged field]
+    vals: [vertical group value]
+    cols: [column variable]
+    index: {vertical group value: row}
+    col_index: {column variable: column}
+    data: {scalar field: 2-D numpy array}
+    has: {scalar field: 2-D boolean numpy array indicating cells set}
+    offsets: {ragged field: 3-D numpy array of the (start, stop) of each
+        cell's pairs (-1: not set)}
+    keys, nums: {ragged field: first and second elements of the pairs},
+        lists until compacted into numpy arrays
+'''
+class CellStore():
+    def __init__(self, cell_type, vals, cols):
+        self._cell_type = cell_type
+        self._vals, self._cols = list(vals), list(cols)
+        self._index = {val: i for i, val in enumerate(self._vals)}
+        self._col_index = {col: j for j, col in enumerate(self._cols)}
+        shape = (len(self._vals), len(self._cols))
+        self._data = {f: np.zeros(shape, dtype)
+            for f, dtype in cell_type.FIELDS.items()}
+        self._has = {f: np.zeros(shape, bool) for f in cell_type.FIELDS}
+        self._offsets = {f: np.full(shape+(2,), -1, dtype=np.int64)
+            for f in cell_type.RAGGED}
+        self._keys = {f: [] for f in cell_type.RAGGED}
+        self._nums = {f: [] for f in cell_type.RAGGED}
+
+    def __len__(self):
+        return len(self._vals)
+
+    # Iterate over vertical group values
+    def __iter__(self):
+        return iter(self._vals)
+
+    # Get views of the cells of a vertical group value (see row)
+    def __getitem__(self, val):
+        return self.row(val)
+
+    # Iterate over (vertical group value, views of its cells)
+    def items(self):
+        return ((val, self.row(val)) for val in self._vals)
+
+    # Get a view of a cell
+    # arguments:
+    #   val: vertical group value
+    #   col: column variable
+    def cell(self, val, col):
+        return self._cell_type(self, self._index[val], self._col_index[col])
+
+    # Get views of the cells of a vertical group value
+    # return: {column variable: cell}
+    def row(self, val):
+        return {col: self.cell(val, col) for col in self._cols}
+
+    # Set a scalar field of a column variable
+    # arguments:
+    #   field: scalar field
+    #   col: column variable
+    #   values: value of each row, or a single value for every row
+    #   rows: row positions to set (None: every row)
+    def set(self, field, col, values, rows=None):
+        rows = slice(None) if rows is None else rows
+        j = self._col_index[col]
+        self._data[field][rows, j] = values
+        self._has[field][rows, j] = True
+
+    # Set a ragged field of a column variable
+    # arguments:
+    #   field: ragged field
+    #   col: column variable
+    #   pairs: [[(key, num)] for each row]
+    #   rows: row positions to set (None: every row)
+    def extend(self, field, col, pairs, rows=None):
+        rows = range(len(self)) if rows is None else rows
+        j = self._col_index[col]
+        keys, nums = self._keys[field], self._nums[field]
+        if not isinstance(keys, list):
+            keys, nums = list(keys), list(nums)
+            self._keys[field], self._nums[field] = keys, nums
+        for i, cell_pairs in zip(rows, pairs):
+            start = len(keys)
+            for key, num in cell_pairs:
+                keys.append(key)
+                nums.append(num)
+            self._offsets[field][i, j] = (start, len(keys))
+
+    # Get a field of a cell
+    # arguments:
+    #   field: scalar or ragged field
+    #   i, j: row and column of the cell
+    # return: value of a scalar field, [(key, num)] of a ragged field (None
+    #   if not set)
+    def get(self, field, i, j):
+        if field in self._data:
+            if not self._has[field][i, j]:
+                return None
+            return self._data[field][i, j]
+        start, stop = self._offsets[field][i, j]
+        if start < 0:
+            return None
+        return list(zip(
+            self._keys[field][start:stop], self._nums[field][start:stop]))
+
+    # Get the set fields of every cell as records, ordered by vertical group
+    # value and column variable
+    # return: {column: numpy array}, with columns
+    #   value: vertical group value
+    #   col: column variable
+    #   statistic: field
+    #   key: first element of a pair of a ragged field, as a string (None 
+    #     for scalar fields)
+    #   estimate: value of a scalar field, or second element of a pair
+    def records(self):
+        self._compact()
+        i, j, statistic, key, estimate = [], [], [], [], []
+        for field in self._data:
+            rows, cols = np.nonzero(self._has[field])
+            i.append(rows)
+            j.append(cols)
+            statistic.append(np.full(len(rows), field, dtype=object))
+            key.append(np.full(len(rows), None, dtype=object))
+            estimate.append(self._data[field][rows, cols].astype(float))
+        for field in self._offsets:
+            start, stop = self._offsets[field].reshape(-1, 2).T
+            cells = np.flatnonzero(start >= 0)
+            lengths = (stop - start)[cells]
+            pairs = np.arange(lengths.sum()) + np.repeat(
+                start[cells] - (np.cumsum(lengths)-lengths), lengths)
+            rows, cols = np.divmod(np.repeat(cells, lengths), len(self._cols))
+            i.append(rows)
+            j.append(cols)
+            statistic.append(np.full(len(rows), field, dtype=object))
+            key.append(_objects([str(k) for k in self._keys[field][pairs]]))
+            estimate.append(self._nums[field][pairs])
+        i, j = np.concatenate(i), np.concatenate(j)
+        order = np.lexsort((j, i))
+        i, j = i[order], j[order]
+        return {
+            'value': _objects(self._vals)[i], 
+            'col': _objects(self._cols)[j],
+            'statistic': np.concatenate(statistic)[order],
+            'key': np.concatenate(key)[order],
+            'estimate': np.concatenate(estimate)[order]}
+
+    # Compact the pairs of ragged fields into numpy arrays
+    def _compact(self):
+        for field in self._keys:
+            if not isinstance(self._keys[field], list):
+                continue
+            self._keys[field] = _objects(self._keys[field])
+            self._nums[field] = np.asarray(self._nums[field], dtype=float)
+
+
+
+# Make a 1-D numpy object array of values, which may be tuples
+def _objects(values):
+    out = np.empty(len(values), dtype=object)
+    for i, val in enumerate(values):
+        out[i] = val
+    return out
@@ -1,11 +1,17 @@
 ##############################################################################
 # Summary Cell
 # by Dillon Bowen
-# last modified 05/23/2019
+# last modified 10/17/2026
 ##############################################################################
 
+import numpy as np
+
 '''
+View of a summary statistics cell of a CellStore
 Data:
+    store: CellStore
+    i, j: row and column of the cell in the store
+Fields:
     N: number of observations
     mean
     std: standard deviation
@@ -13,40 +19,55 @@ Data:
     freq: [(val, freq)]
 '''
 class SummaryCell():
-    _N = None
-    _mean = None
-    _std = None
-    _pctiles = None
-    _freq = None
+    FIELDS = {'N': np.int64, 'mean': float, 'std': float}
+    RAGGED = ['pctiles', 'freq']
+    __slots__ = ['_store', '_i', '_j']
     
+    def __init__(self, store, i, j):
+        self._store, self._i, self._j = store, i, j
+        
     def N(self, N):
-        self._N = N
+        self._set('N', N)
         
     def mean(self, mean):
-        self._mean = mean
+        self._set('mean', mean)
         
     def std(self, std):
-        self._std = std
+        self._set('std', std)
         
     def pctiles(self, pctiles):
-        self._pctiles = pctiles
+        self._set('pctiles', pctiles)
         
     def freq(self, freq):
-        self._freq = freq
+        self._set('freq', freq)
+        
+    # Set a field of the cell
+    def _set(self, field, value):
+        col = self._store._cols[self._j]
+        if field in self.RAGGED:
+            self._store.extend(field, col, [value], [self._i])
+        else:
+            self._store.set(field, col, value, [self._i])
+            
+    # Get a field of the cell (None if not set)
+    def _get(self, field):
+        return self._store.get(field, self._i, self._j)
         
-    def _write(self, ws, row, col, format):
+    def _text(self):
+        mean, std, N = self._get('mean'), self._get('std'), self._get('N')
+        pctiles, freq = self._get('pctiles'), self._get('freq')
         text = ''
-        if self._mean is not None:
-            text += '{:.2f} \n'.format(self._mean)
-        if self._std is not None:
-            text += '({:.2f}) \n'.format(self._std)
-        if self._pctiles is not None:
-            for pctile, val in self._pctiles:
+        if mean is not None:
+            text += '{:.2f} \n'.format(mean)
+        if std is not None:
+            text += '({:.2f}) \n'.format(std)
+        if pctiles is not None:
+            for pctile, val in pctiles:
                 text += 'p{} = {:.2f} \n'.format(pctile, val)
-        if self._freq is not None:
-            for val, freq in self._freq:
-                text += '{}: {:.2f} \n'.format(val, freq)
-        if self._N is not None:
-            text += 'N={}'.format(self._N)
+        if freq is not None:
+            for val, f in freq:
+                text += '{}: {:.2f} \n'.format(val, f)
+        if N is not None:
+            text += 'N={}'.format(N)
 
-        ws.write(row, col, text, format)
\ No newline at end of file
+        return text
\ No newline at end of file
@@ -0,0 +1,145 @@
+##############################################################################
+# Grouped Binary Response Models
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+from autoanalyzer.estimators.ols import (
+    GroupedOLSResults, OLSResults, grouped_cross)
+from scipy.special import expit, log_ndtr
+import numpy as np
+
+# Binary response models
+MODELS = ['logit', 'probit']
+
+# Newton's method stops when no parameter changes by more than TOL, or
+# after MAXITER iterations, as in statsmodels
+TOL = 1e-8
+MAXITER = 35
+
+'''
+Results of a binary response model fit separately for every group
+Data: see GroupedOLSResults
+    converged: [indicator that Newton's method converged for each group]
+    iterations: [number of iterations for each group]
+NOTE: p values are from the normal distribution, as in statsmodels
+'''
+class GroupedBinaryResults(GroupedOLSResults):
+    def __init__(self, params, cov, nobs, converged, iterations):
+        GroupedOLSResults.__init__(
+            self, params, cov, nobs, nobs-params.shape[1], False)
+        self.converged = converged
+        self.iterations = iterations
+
+# Fit a binary response model separately for every group, all groups at
+# once
+# every Newton iteration updates all groups with grouped reductions of the
+# score and information, reusing row buffers allocated once
+# groups stop updating when they converge
+# arguments:
+#   y: numpy array of the dependent variable (0 or 1)
+#   X: 2-D numpy array of regressors
+#   codes: numpy array of the group of each row, in range(ngroups)
+#   ngroups: number of groups
+#   model: binary response model (see MODELS)
+#   start: [starting parameter] shared by all groups (default: zeros), e.g.
+#     the parameters of the pooled fit
+#   tol, maxiter: see TOL and MAXITER
+# return: GroupedBinaryResults
+def grouped_binary(
+        y, X, codes, ngroups, model='logit', start=None,
+        tol=TOL, maxiter=MAXITER):
+    if model not in MODELS:
+        raise ValueError('Unsupported binary response model: '+str(model))
+    if np.any((y != 0) & (y != 1)):
+        raise ValueError('Binary response must be 0 or 1')
+    params = np.zeros((ngroups, X.shape[1]))
+    if start is not None:
+        params[:] = start
+    buffers = _Buffers(y, X, model)
+    nobs = np.bincount(codes, minlength=ngroups)
+    converged = nobs == 0
+    iterations = np.zeros(ngroups, dtype=int)
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        for i in range(maxiter):
+            score, info = buffers.derivatives(params, codes, ngroups)
+            step = np.einsum('gij,gj->gi', np.linalg.pinv(info), score)
+            step[converged] = 0
+            params += step
+            iterations += ~converged
+            converged |= np.abs(step).max(axis=1) <= tol
+            if converged.all():
+                break
+        score, info = buffers.derivatives(params, codes, ngroups)
+        cov = np.linalg.pinv(info)
+    converged &= nobs > 0
+    return GroupedBinaryResults(params, cov, nobs, converged, iterations)
+
+# Fit a binary response model of a single sample
+# arguments: see grouped_binary
+# return: OLSResults (with converged and iterations)
+def fit(y, X, model='logit', start=None, tol=TOL, maxiter=MAXITER):
+    codes = np.zeros(len(y), dtype=np.intp)
+    return OLSResults(grouped_binary(
+        y, X, codes, 1, model, start, tol, maxiter))
+
+
+
+##############################################################################
+# Derivatives
+##############################################################################
+
+'''
+Row buffers for the derivatives of the log likelihood
+Data:
+    y, X, model: see grouped_binary
+    q: 2y-1
+    params: parameters of the group of each row
+    xb: linear prediction
+    score: score weight of each row (d loglike / d xb)
+    info: information weight of each row (-d^2 loglike / d xb^2)
+    Xw: X * information weight
+'''
+class _Buffers():
+    def __init__(self, y, X, model):
+        self._y, self._X, self._model = y, X, model
+        self._q = 2*y - 1
+        self._params = np.empty(X.shape)
+        self._xb = np.empty(len(y))
+        self._score = np.empty(len(y))
+        self._info = np.empty(len(y))
+        self._Xw = np.empty(X.shape)
+
+    # Compute the score and information of every group
+    # return: (score (ngroups x parameters),
+    #   information (ngroups x parameters x parameters))
+    def derivatives(self, params, codes, ngroups):
+        np.take(params, codes, axis=0, out=self._params)
+        np.einsum('nk,nk->n', self._X, self._params, out=self._xb)
+        if self._model == 'logit':
+            self._logit()
+        else:
+            self._probit()
+        np.multiply(self._X, self._info[:,None], out=self._Xw)
+        score = grouped_cross(self._X, self._score[:,None], codes, ngroups)
+        info = grouped_cross(self._Xw, self._X, codes, ngroups)
+        return (score[:,:,0], info)
+
+    # Logit weights
+    # score: y - p, information: p(1-p)
+    def _logit(self):
+        expit(self._xb, out=self._info)
+        np.subtract(self._y, self._info, out=self._score)
+        self._info *= 1 - self._info
+
+    # Probit weights (observed information, as in statsmodels)
+    # score: L = q pdf(q xb) / cdf(q xb), information: L(L + xb)
+    def _probit(self):
+        np.multiply(self._q, self._xb, out=self._info)
+        np.exp(
+            -self._info**2/2 - np.log(np.sqrt(2*np.pi))
+            - log_ndtr(self._info), out=self._score)
+        self._score *= self._q
+        np.add(self._score, self._xb, out=self._info)
+        self._info *= self._score
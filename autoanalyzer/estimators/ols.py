@@ -0,0 +1,335 @@
+##############################################################################
+# Grouped Ordinary Least Squares
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse import coo_matrix
+from scipy import stats
+import pandas as pd
+import numpy as np
+import warnings
+
+# Covariance types supported by grouped OLS
+COV_TYPES = ['nonrobust', 'HC0', 'HC1', 'HC2', 'HC3', 'cluster']
+
+# Groups whose X'X is closer than this to singular are fit by pseudoinverse
+# of their rows, as in statsmodels
+RCOND = 1e-10
+
+'''
+Results of OLS fit separately for every group
+Data:
+    params: [[parameter estimate] for each group]
+    bse: [[parameter standard error] for each group]
+    tvalues: [[t value for parameter == 0] for each group]
+    pvalues: [[p value for parameter == 0] for each group]
+    nobs: [number of observations for each group]
+    df_resid: [residual degrees of freedom for each group]
+NOTE: all data are numpy arrays, parameters follow the columns of X
+'''
+class GroupedOLSResults():
+    def __init__(self, params, cov, nobs, df_resid, use_t):
+        self.params = params
+        self.nobs = nobs
+        self.df_resid = df_resid
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.bse = np.sqrt(np.diagonal(cov, axis1=1, axis2=2))
+            self.tvalues = params / self.bse
+        if use_t:
+            self.pvalues = 2*stats.t.sf(
+                np.abs(self.tvalues), df_resid[:,None])
+        else:
+            self.pvalues = 2*stats.norm.sf(np.abs(self.tvalues))
+
+'''
+Results of a single OLS fit
+Data: see GroupedOLSResults, for a single group
+'''
+class OLSResults():
+    def __init__(self, grouped_results, group=0):
+        for attr, value in vars(grouped_results).items():
+            setattr(self, attr, value[group])
+            
+# Fit OLS of a single sample
+# computes only parameters, standard errors, t values and p values, 
+# without the diagnostics of a statsmodels results object
+# cross products are computed by matrix products rather than grouped 
+# reductions
+# a sample with no rows has missing results
+# arguments: see grouped_ols
+# return: OLSResults
+def fit(y, X, cov_type='nonrobust', clusters=None):
+    if cov_type not in COV_TYPES:
+        raise ValueError('Unsupported covariance type: '+str(cov_type))
+    nobs, k = X.shape
+    if nobs == 0:
+        return missing_results(k)
+    XtX = X.T.dot(X)
+    eigvals = np.linalg.eigvalsh(XtX)
+    if eigvals[0] > RCOND*eigvals[-1]:
+        inv, rank = np.linalg.inv(XtX), k
+    else:
+        pinv = np.linalg.pinv(X)
+        inv, rank = pinv.dot(pinv.T), np.linalg.matrix_rank(X)
+    params = inv.dot(X.T.dot(y))
+    resid = y - X.dot(params)
+    nobs, df_resid = np.int64(nobs), np.int64(nobs - rank)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if cov_type == 'nonrobust':
+            cov = inv * resid.dot(resid) / df_resid
+        elif cov_type == 'cluster':
+            codes, uniques = pd.factorize(clusters)
+            nclusters = np.int64(len(uniques))
+            sums = np.column_stack([np.bincount(codes, s, nclusters) 
+                for s in (X*resid[:,None]).T])
+            cov = inv.dot(sums.T.dot(sums)).dot(inv)
+            cov *= nclusters / (nclusters-1) * (nobs-1) / (nobs-k)
+        else:
+            weights = resid**2
+            if cov_type in ['HC2', 'HC3']:
+                leverage = np.einsum('ij,ij->i', X.dot(inv), X)
+                weights /= (1-leverage)**(1 if cov_type == 'HC2' else 2)
+            cov = inv.dot((X*weights[:,None]).T.dot(X)).dot(inv)
+            if cov_type == 'HC1':
+                cov *= nobs / df_resid
+    return OLSResults(GroupedOLSResults(
+        params[None], cov[None], np.array([nobs]), np.array([df_resid]), 
+        cov_type == 'nonrobust'))
+        
+# Get results of a sample with no rows, every one of which is missing
+# k: number of parameters
+# return: OLSResults
+def missing_results(k):
+    return OLSResults(GroupedOLSResults(
+        np.full((1, k), np.nan), np.full((1, k, k), np.nan), 
+        np.zeros(1, dtype=int), np.zeros(1, dtype=int), True))
+        
+# Fit OLS separately for every group, all groups at once
+# X'X and X'y of every group are computed by grouped reductions, and every 
+# group's system is solved in one stacked call
+# arguments:
+#   y: numpy array of the dependent variable
+#   X: 2-D numpy array of regressors
+#   codes: numpy array of the group of each row, in range(ngroups)
+#   ngroups: number of groups
+#   cov_type: covariance type (see COV_TYPES)
+#   clusters: numpy array of the cluster of each row, as integer codes
+#     (required for cluster covariance)
+#   df_absorbed: [degrees of freedom absorbed by fixed effects for each 
+#     group] (see grouped_demean)
+# return: GroupedOLSResults
+def grouped_ols(
+        y, X, codes, ngroups, cov_type='nonrobust', clusters=None, 
+        df_absorbed=None):
+    return grouped_ols_multi(
+        y[:,None], X, codes, ngroups, cov_type, clusters, df_absorbed)[0]
+        
+# Fit OLS of several dependent variables on the same regressors separately 
+# for every group
+# X is factorized (X'X inverted) once for every group and shared by all 
+# dependent variables
+# arguments:
+#   Y: 2-D numpy array of dependent variables
+#   other arguments: see grouped_ols
+# return: [GroupedOLSResults for each column of Y]
+def grouped_ols_multi(
+        Y, X, codes, ngroups, cov_type='nonrobust', clusters=None, 
+        df_absorbed=None):
+    if cov_type not in COV_TYPES:
+        raise ValueError('Unsupported covariance type: '+str(cov_type))
+    nobs = np.bincount(codes, minlength=ngroups)
+    inv, rank = grouped_inv(X, codes, ngroups)
+    nparams = np.full(ngroups, X.shape[1])
+    if df_absorbed is not None:
+        rank, nparams = rank + df_absorbed, nparams + df_absorbed
+    df_resid = nobs - rank
+    params = inv @ grouped_cross(X, Y, codes, ngroups)
+    leverage = None
+    if cov_type in ['HC2', 'HC3']:
+        leverage = grouped_quadratic_form(X, inv, codes)
+    return [_grouped_ols_results(
+        Y[:,i], X, codes, ngroups, cov_type, clusters, 
+        params[:,:,i], inv, nobs, df_resid, nparams, leverage) 
+        for i in range(Y.shape[1])]
+        
+# Absorb fixed effects by demeaning separately for every group
+# the columns of A are demeaned within each fixed effect level of each group
+# by alternating projections, iterating over the fixed effects until the 
+# largest mean removed falls below tol (relative to the scale of A); a 
+# RuntimeWarning is issued if this takes more than maxiter iterations
+# each fixed effect absorbs a degree of freedom for every level observed in 
+# a group, less the levels which are redundant
+# the levels of the first two fixed effects are redundant once for every 
+# connected component of the graph of levels observed in the same rows, 
+# which is exact; each further fixed effect is counted redundant once, 
+# which is exact only if its levels are connected to the others
+# arguments:
+#   A: 2-D numpy array to demean
+#   codes, ngroups: see grouped_ols
+#   absorb: [numpy array of fixed effect level of each row, as integer 
+#     codes]
+#   tol: convergence tolerance
+#   maxiter: maximum number of iterations
+# return: (demeaned A, [degrees of freedom absorbed for each group])
+def grouped_demean(A, codes, ngroups, absorb, tol=1e-10, maxiter=10000):
+    A = np.array(A, dtype=float)
+    df_absorbed = np.zeros(ngroups, dtype=int)
+    levels, level_groups = [], []
+    for fe in absorb:
+        size = fe.max()+1 if len(fe) else 1
+        level_codes, level_vals = pd.factorize(
+            codes.astype(np.int64)*size + fe)
+        levels.append((level_codes, np.bincount(level_codes)))
+        level_groups.append(level_vals // size)
+        df_absorbed += np.bincount(level_groups[-1], minlength=ngroups)
+    if len(levels) > 1:
+        df_absorbed -= _grouped_components(
+            levels[:2], level_groups[0], ngroups)
+        nobs = np.bincount(codes, minlength=ngroups)
+        df_absorbed -= (len(levels)-2) * (nobs > 0)
+    
+    tol *= max(np.abs(A).max(initial=0), 1)
+    for i in range(maxiter):
+        change = 0
+        for level_codes, counts in levels:
+            means = np.column_stack([np.bincount(level_codes, a, len(counts))
+                for a in A.T]) / counts[:,None]
+            A -= means[level_codes]
+            change = max(change, np.abs(means).max(initial=0))
+        if len(levels) < 2 or change < tol:
+            break
+    else:
+        warnings.warn(
+            'Absorbing fixed effects did not converge in {} iterations'
+            .format(maxiter), RuntimeWarning)
+    return (A, df_absorbed)
+    
+# Count the connected components of the graph of the levels of two fixed 
+# effects in every group, in which levels observed in the same row are
+# connected
+# arguments:
+#   levels: [(level codes of each row, count of each level)] of the two 
+#     fixed effects (see grouped_demean)
+#   groups: numpy array of the group of each level of the first fixed 
+#     effect
+#   ngroups: number of groups
+# return: numpy array of the number of components of every group
+def _grouped_components(levels, groups, ngroups):
+    (codes1, counts1), (codes2, counts2) = levels
+    nlevels = len(counts1) + len(counts2)
+    graph = coo_matrix(
+        (np.ones(len(codes1)), (codes1, codes2+len(counts1))), 
+        shape=(nlevels, nlevels))
+    ncomponents, labels = connected_components(graph, directed=False)
+    component_groups = np.zeros(ncomponents, dtype=int)
+    component_groups[labels[:len(counts1)]] = groups
+    return np.bincount(component_groups, minlength=ngroups)
+        
+# Invert X'X separately for every group
+# groups whose X'X is singular are inverted by pseudoinverse of their rows
+# groups with no rows have rank 0 and a missing inverse, so that their 
+# results are missing
+# return: (numpy array of (X'X)^-1 of every group, [rank of every group])
+def grouped_inv(X, codes, ngroups):
+    XtX = grouped_cross(X, X, codes, ngroups)
+    inv = np.empty(XtX.shape)
+    rank = np.full(ngroups, X.shape[1])
+    eigvals = np.linalg.eigvalsh(XtX)
+    singular = eigvals[:,0] <= RCOND*eigvals[:,-1]
+    inv[~singular] = np.linalg.inv(XtX[~singular])
+    for g in np.flatnonzero(singular):
+        rows = X[codes == g]
+        if len(rows) == 0:
+            inv[g], rank[g] = np.nan, 0
+            continue
+        pinv = np.linalg.pinv(rows)
+        inv[g] = pinv.dot(pinv.T)
+        rank[g] = np.linalg.matrix_rank(rows)
+    return (inv, rank)
+    
+# Compute covariance and results of a single dependent variable, given the
+# factorization of X
+# nparams: [number of parameters of each group, including absorbed]
+# leverage: x_n' (X'X)^-1 x_n of every row (required for HC2 and HC3)
+# return: GroupedOLSResults
+def _grouped_ols_results(
+        y, X, codes, ngroups, cov_type, clusters, 
+        params, inv, nobs, df_resid, nparams, leverage):
+    resid = y - np.einsum('nk,nk->n', X, params[codes])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if cov_type == 'nonrobust':
+            scale = np.bincount(codes, resid**2, ngroups) / df_resid
+            cov = inv * scale[:,None,None]
+            return GroupedOLSResults(params, cov, nobs, df_resid, True)
+            
+        if cov_type == 'cluster':
+            cov = grouped_cluster_cov(
+                X*resid[:,None], inv, codes, ngroups, clusters)
+            cov *= ((nobs-1) / (nobs-nparams))[:,None,None]
+            return GroupedOLSResults(params, cov, nobs, df_resid, False)
+            
+        weights = resid**2
+        if cov_type in ['HC2', 'HC3']:
+            weights /= (1-leverage)**(1 if cov_type == 'HC2' else 2)
+        meat = grouped_cross(X*weights[:,None], X, codes, ngroups)
+        cov = inv @ meat @ inv
+        if cov_type == 'HC1':
+            cov *= (nobs / df_resid)[:,None,None]
+    return GroupedOLSResults(params, cov, nobs, df_resid, False)
+    
+# Compute cluster-robust covariance separately for every group
+# scores are summed within (group, cluster) pairs by grouped reductions, and
+# the meat of each group is the cross product of its cluster score sums
+# includes the small sample correction for the number of clusters, G/(G-1)
+# arguments:
+#   scores: 2-D numpy array of scores (x_n * residual_n)
+#   inv: numpy array of (X'X)^-1 of every group
+#   codes, ngroups: see grouped_ols
+#   clusters: numpy array of the cluster of each row, as integer codes
+# return: numpy array (ngroups x parameters x parameters)
+def grouped_cluster_cov(scores, inv, codes, ngroups, clusters):
+    pairs = codes.astype(np.int64) * (clusters.max()+1) + clusters
+    pair_codes, pairs = pd.factorize(pairs)
+    pair_group = pairs // (clusters.max()+1)
+    sums = np.column_stack([np.bincount(pair_codes, s, len(pairs)) 
+        for s in scores.T])
+    return cluster_sandwich(sums, pair_group, inv, ngroups)
+    
+# Compute cluster-robust covariance of every group from the score sums of 
+# its clusters, with the G/(G-1) correction
+# arguments:
+#   sums: 2-D numpy array of the score sum of each (group, cluster) pair
+#   pair_group: numpy array of the group of each pair
+#   inv, ngroups: see grouped_cluster_cov
+# return: numpy array (ngroups x parameters x parameters)
+def cluster_sandwich(sums, pair_group, inv, ngroups):
+    meat = grouped_cross(sums, sums, pair_group, ngroups)
+    nclusters = np.bincount(pair_group, minlength=ngroups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correction = nclusters / (nclusters-1)
+    return inv @ meat @ inv * correction[:,None,None]
+    
+# Compute A'B separately for every group
+# each entry is a single grouped sum (bincount) over rows
+# return: numpy array (ngroups x A columns x B columns)
+def grouped_cross(A, B, codes, ngroups):
+    symmetric = A is B
+    out = np.empty((ngroups, A.shape[1], B.shape[1]))
+    for i in range(A.shape[1]):
+        for j in range(i if symmetric else 0, B.shape[1]):
+            out[:,i,j] = np.bincount(codes, A[:,i]*B[:,j], ngroups)
+            if symmetric:
+                out[:,j,i] = out[:,i,j]
+    return out
+    
+# Compute x_n' M_g x_n for every row n of X, where g is the group of row n
+# return: numpy array of length X rows
+def grouped_quadratic_form(X, M, codes):
+    out = np.zeros(X.shape[0])
+    for i in range(X.shape[1]):
+        for j in range(X.shape[1]):
+            out += X[:,i] * X[:,j] * M[codes,i,j]
+    return out
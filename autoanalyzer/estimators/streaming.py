@@ -0,0 +1,229 @@
+##############################################################################
+# Streaming Ordinary Least Squares
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+from autoanalyzer.bases.frame_base import FrameBase
+from autoanalyzer.bases.writer_base import POOLED_VAL
+from autoanalyzer.estimators.ols import (
+    GroupedOLSResults, RCOND, grouped_cross, cluster_sandwich)
+import pandas as pd
+import numpy as np
+
+# Covariance types supported by streaming OLS
+# (HC covariance requires the residual of every row)
+COV_TYPES = ['nonrobust', 'cluster']
+
+'''
+OLS fit separately for every value of a group variable from sufficient
+statistics accumulated over chunks of rows
+memory is constant in the number of rows (and linear in the number of
+group values and, for cluster covariance, of clusters)
+used by Analysis with engine='streaming', and standalone, e.g. 
+StreamingOLS('y', ['x', '_const'], 'g').fit(
+    pd.read_csv(path, chunksize=100000))
+Data:
+    y: dependent variable
+    X: [exogenous variable] ('_const' is a column of ones)
+    group: group variable (None for a single pooled group)
+    cov_type: covariance type (see COV_TYPES)
+    cov_kwds: covariance keywords ({'groups': cluster variable} for
+        cluster covariance)
+    group_index: _ValueIndex of group values
+    cluster_index: _ValueIndex of clusters
+    pair_index: _ValueIndex of (group, cluster) pairs
+    XtX, Xty, yty, nobs: sufficient statistics of each group
+    pair_XtX, pair_Xty: sufficient statistics of each (group, cluster) pair
+    pair_group: [group of each (group, cluster) pair]
+NOTE: rows with missing values are dropped, as in Analysis
+NOTE: group values are taken as given; numeric variables are not binned
+'''
+class StreamingOLS():
+    def __init__(
+            self, y, X, group=None, cov_type='nonrobust', cov_kwds={}):
+        if cov_type not in COV_TYPES:
+            raise ValueError(
+                'Unsupported covariance type for streaming OLS: '
+                + str(cov_type))
+        if cov_type == 'cluster' and list(cov_kwds) != ['groups']:
+            raise ValueError(
+                "Cluster covariance requires cov_kwds={'groups': var}")
+        self._y, self._X, self._group = y, list(X), group
+        self._cov_type, self._cov_kwds = cov_type, cov_kwds
+        k = len(self._X)
+        self._group_index = _ValueIndex()
+        self._cluster_index = _ValueIndex()
+        self._pair_index = _ValueIndex()
+        self._XtX, self._Xty = np.zeros((0, k, k)), np.zeros((0, k))
+        self._yty, self._nobs = np.zeros(0), np.zeros(0, dtype=int)
+        self._pair_XtX, self._pair_Xty = np.zeros((0, k, k)), np.zeros((0, k))
+        self._pair_group = np.zeros(0, dtype=int)
+
+    # Accumulate every chunk of an iterable and compute results
+    # chunks: iterable of DataFrames, e.g. pd.read_csv(..., chunksize=n)
+    # return: see results
+    def fit(self, chunks):
+        [self.update(chunk) for chunk in chunks]
+        return self.results()
+
+    # Accumulate sufficient statistics of a chunk of rows
+    # chunk: pandas or autoanalyzer DataFrame
+    # group_codes: numpy array of the group of each row, as integer codes 
+    #   (-1: no group), given instead of the group variable; the group 
+    #   values of the results are then the codes
+    def update(self, chunk, group_codes=None):
+        if isinstance(chunk, FrameBase):
+            chunk = chunk.data
+        y, X, codes, clusters = self._read_chunk(chunk, group_codes)
+        ngroups = len(self._group_index)
+        self._XtX = _grow(self._XtX, ngroups)
+        self._Xty = _grow(self._Xty, ngroups)
+        self._yty = _grow(self._yty, ngroups)
+        self._nobs = _grow(self._nobs, ngroups)
+
+        self._yty += np.bincount(codes, y**2, ngroups)
+        self._nobs += np.bincount(codes, minlength=ngroups)
+        if clusters is None:
+            self._XtX += grouped_cross(X, X, codes, ngroups)
+            self._Xty += grouped_cross(X, y[:,None], codes, ngroups)[:,:,0]
+            return
+
+        # pairs are keyed by (group code, cluster code), both of which are
+        # stable across chunks
+        pair_codes, pairs = pd.factorize(
+            codes.astype(np.int64) << 32 | clusters)
+        rows = self._pair_index.codes(pairs)
+        npairs = len(self._pair_index)
+        self._pair_XtX = _grow(self._pair_XtX, npairs)
+        self._pair_Xty = _grow(self._pair_Xty, npairs)
+        self._pair_group = _grow(self._pair_group, npairs)
+        self._pair_group[rows] = pairs >> 32
+
+        XtX = grouped_cross(X, X, pair_codes, len(pairs))
+        Xty = grouped_cross(X, y[:,None], pair_codes, len(pairs))[:,:,0]
+        self._pair_XtX[rows] += XtX
+        self._pair_Xty[rows] += Xty
+        self._XtX += _group_sum(XtX, pairs >> 32, ngroups)
+        self._Xty += _group_sum(Xty, pairs >> 32, ngroups)
+
+    # Read the complete rows of a chunk
+    # group_codes: see update
+    # return: (y, X, group codes, cluster codes (None if not clustered))
+    def _read_chunk(self, chunk, group_codes=None):
+        nrows = len(chunk)
+        y = pd.to_numeric(chunk[self._y]).to_numpy(float, na_value=np.nan)
+        X = np.column_stack([np.ones(nrows) if v == '_const'
+            else pd.to_numeric(chunk[v]).to_numpy(float, na_value=np.nan)
+            for v in self._X]).reshape(nrows, len(self._X))
+        complete = ~np.isnan(y) & ~np.isnan(X).any(axis=1)
+
+        if group_codes is not None:
+            complete &= group_codes >= 0
+            values, inverse = np.unique(
+                group_codes[complete], return_inverse=True)
+            codes = np.zeros(nrows, dtype=np.int64)
+            codes[complete] = self._group_index.codes(values)[inverse]
+        elif self._group is None:
+            codes = np.zeros(nrows, dtype=np.int64)
+            self._group_index.codes([POOLED_VAL])
+        else:
+            codes, values = pd.factorize(chunk[self._group])
+            complete &= codes >= 0
+            codes = self._group_index.codes(values)[codes]
+
+        clusters = None
+        if self._cov_type == 'cluster':
+            clusters, values = pd.factorize(chunk[self._cov_kwds['groups']])
+            complete &= clusters >= 0
+            clusters = self._cluster_index.codes(values)[clusters]
+            clusters = clusters[complete]
+        return (y[complete], X[complete], codes[complete], clusters)
+
+    # Compute results from the accumulated sufficient statistics
+    # groups whose X'X is singular are inverted by pseudoinverse of X'X
+    # groups with no complete rows have missing results
+    # return: ([group value], GroupedOLSResults), in sorted order of group
+    # values
+    def results(self):
+        values, order = self._group_index.sorted()
+        XtX, Xty = self._XtX[order], self._Xty[order]
+        yty, nobs = self._yty[order], self._nobs[order]
+
+        inv = np.empty(XtX.shape)
+        rank = np.full(len(values), len(self._X))
+        eigvals = np.linalg.eigvalsh(XtX)
+        singular = eigvals[:,0] <= RCOND*eigvals[:,-1]
+        inv[~singular] = np.linalg.inv(XtX[~singular])
+        for g in np.flatnonzero(singular):
+            inv[g] = np.linalg.pinv(XtX[g], hermitian=True)
+            rank[g] = np.linalg.matrix_rank(XtX[g], hermitian=True)
+        inv[nobs == 0], rank[nobs == 0] = np.nan, 0
+        params = np.einsum('gij,gj->gi', inv, Xty)
+        df_resid = nobs - rank
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if self._cov_type == 'nonrobust':
+                ssr = yty - np.einsum('gi,gi->g', params, Xty)
+                cov = inv * (ssr / df_resid)[:,None,None]
+                return (values, GroupedOLSResults(
+                    params, cov, nobs, df_resid, True))
+
+            # score sum of each cluster: X_c'y_c - X_c'X_c b
+            group = np.argsort(order)[self._pair_group]
+            sums = self._pair_Xty - np.einsum(
+                'pij,pj->pi', self._pair_XtX, params[group])
+            cov = cluster_sandwich(sums, group, inv, len(values))
+            cov *= ((nobs-1) / (nobs-len(self._X)))[:,None,None]
+        return (values, GroupedOLSResults(params, cov, nobs, df_resid, False))
+
+
+
+##############################################################################
+# Helpers
+##############################################################################
+
+'''
+Stable integer codes of values seen across chunks
+Data:
+    codes: {value: code}
+    values: [value of each code]
+'''
+class _ValueIndex():
+    def __init__(self):
+        self._codes, self._values = {}, []
+
+    def __len__(self):
+        return len(self._values)
+
+    # Get codes of distinct values, adding new values
+    # return: numpy array of codes
+    def codes(self, values):
+        out = np.empty(len(values), dtype=np.int64)
+        for i, val in enumerate(values):
+            if val not in self._codes:
+                self._codes[val] = len(self._values)
+                self._values.append(val)
+            out[i] = self._codes[val]
+        return out
+
+    # Get values in sorted order (order of appearance if not sortable)
+    # return: ([value], numpy array of the code of each sorted value)
+    def sorted(self):
+        try:
+            order = sorted(range(len(self)), key=self._values.__getitem__)
+        except TypeError:
+            order = list(range(len(self)))
+        return ([self._values[i] for i in order], np.array(order, dtype=int))
+
+# Extend an array of statistics with zeros to the given length
+def _grow(a, length):
+    if len(a) >= length:
+        return a
+    return np.concatenate([a, np.zeros((length-len(a),)+a.shape[1:], a.dtype)])
+
+# Sum statistics (first axis) by group
+def _group_sum(a, codes, ngroups):
+    out = np.zeros((ngroups,)+a.shape[1:])
+    np.add.at(out, codes, a)
+    return out
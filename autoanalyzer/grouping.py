@@ -0,0 +1,87 @@
+##############################################################################
+# Grouping
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+from autoanalyzer.bases.writer_base import POOLED_VAL
+import numpy as np
+
+'''
+Data:
+    df: DataFrame being grouped
+    codes: numpy array of the group of each row of df (-1: no group)
+    values: [group value], where codes index values
+    group: group variable ('Pooled' for the pooled grouping)
+    positions: [numpy array of row positions of each group]
+'''
+class Grouping():
+    def __init__(self, df, codes, values, group=None):
+        self._df = df
+        self._codes = codes
+        self._values = values
+        self._group = group
+        self._positions = None
+        
+    # Create a grouping with a single (pooled) group of every row
+    @classmethod
+    def pooled(cls, df):
+        grouping = cls(
+            df, np.zeros(len(df), dtype=int), [POOLED_VAL], 'Pooled')
+        grouping._positions = [None]
+        return grouping
+        
+    # Get row positions of each group
+    # computed once, by a single stable sort of the codes
+    def positions(self):
+        if self._positions is None:
+            order = np.argsort(self._codes, kind='stable')
+            counts = np.bincount(
+                self._codes+1, minlength=len(self._values)+1)
+            self._positions = np.split(order, np.cumsum(counts)[:-1])[1:]
+        return self._positions
+        
+    # Generate (group value, DataFrame of the group's rows)
+    def frames(self):
+        for val, positions in zip(self._values, self.positions()):
+            if positions is None:
+                yield val, self._df
+            else:
+                yield val, self._df.take(positions)
+
+
+
+'''
+Data:
+    codes: {group variable: numpy array of the group of each row}
+    values: {group variable: [group value], where codes index values}
+NOTE: codes refer to rows of the DataFrame the index was built for
+'''
+class GroupIndex():
+    def __init__(self):
+        self._codes = {}
+        self._values = {}
+        
+    # Add a group variable
+    def add(self, group, codes, values):
+        self._codes[group] = codes
+        self._values[group] = values
+        
+    # Get a Grouping of a subset of rows by a group variable
+    # values not observed in the subset are dropped
+    # arguments:
+    #   group: group variable
+    #   df: DataFrame of the subset
+    #   rows: row positions of the subset (None for every row)
+    def grouping(self, group, df, rows=None):
+        codes, values = self._codes[group], self._values[group]
+        if rows is not None:
+            codes = codes[rows]
+        counts = np.bincount(codes+1, minlength=len(values)+1)[1:]
+        observed = np.flatnonzero(counts)
+        if len(observed) < len(values):
+            recode = np.full(len(values)+1, -1)
+            recode[observed+1] = np.arange(len(observed))
+            codes = recode[codes+1]
+            values = [values[i] for i in observed]
+        return Grouping(df, codes, values, group)
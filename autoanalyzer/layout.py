@@ -0,0 +1,74 @@
+##############################################################################
+# Layout
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+'''
+Row-major layout of a table
+tables and blocks place their cells in a 2-D grid before anything is
+written, so that a backend can emit the grid row by row in a single
+sequential pass
+Data:
+    first_row: worksheet row of the first row of the grid
+    grid: [[(value, format name) or None for each column] for each row]
+    merges: {(row, col): (last row, last col)} of merged ranges, keyed by
+        their first cell, which holds the value of the range
+'''
+class Layout():
+    def __init__(self, first_row=0):
+        self._first_row = first_row
+        self._grid = []
+        self._merges = {}
+
+    # Place a value in a cell
+    # arguments:
+    #   row, col: worksheet row and column of the cell
+    #   value: value of the cell
+    #   format: name of the cell format (see Writer._init_workbook)
+    def write(self, row, col, value, format):
+        i = row - self._first_row
+        if i >= len(self._grid):
+            self._grid.extend([] for _ in range(i+1-len(self._grid)))
+        cells = self._grid[i]
+        if col >= len(cells):
+            cells.extend([None]*(col+1-len(cells)))
+        cells[col] = (value, format)
+
+    # Place a value in a merged range of cells
+    def merge_range(
+            self, first_row, first_col, last_row, last_col, value, format):
+        self.write(first_row, first_col, value, format)
+        self._merges[(first_row, first_col)] = (last_row, last_col)
+
+    # Get the worksheet row after the last row of the grid
+    def end_row(self):
+        return self._first_row + len(self._grid)
+
+    # Get the number of columns of the grid, including merged ranges
+    def ncols(self):
+        return max([len(cells) for cells in self._grid]
+            + [col+1 for row, col in self._merges.values()] + [0])
+
+    # Iterate over the rows of the grid in order
+    # yield: (row, [(col, value, format name,
+    #   (last row, last col) of a merged range or None)])
+    def rows(self):
+        for i, cells in enumerate(self._grid):
+            row = self._first_row + i
+            yield (row, [
+                (col, cell[0], cell[1], self._merges.get((row, col)))
+                for col, cell in enumerate(cells) if cell is not None])
+
+    # Write the grid to a worksheet row by row
+    # arguments:
+    #   ws: xlsxwriter Worksheet
+    #   formats: {format name: xlsxwriter Format}
+    def _write(self, ws, formats):
+        for row, cells in self.rows():
+            for col, value, format, merge in cells:
+                if merge is None:
+                    ws.write(row, col, value, formats[format])
+                else:
+                    ws.merge_range(
+                        row, col, *merge, value, formats[format])
@@ -6,21 +6,27 @@
 
 from autoanalyzer.bases.block_base import BlockBase
 from autoanalyzer.bases.writer_base import POOLED_VAL
+from autoanalyzer.grouping import Grouping
+from autoanalyzer.aggregates import Aggregates
 from copy import deepcopy
+import pandas as pd
+import numpy as np
 import xlsxwriter
 
 '''
 Data:
     title
     vars: [summary variable]
-    cells: {vgroup: {vgroup_val: {var: SummaryCell}}}
-    row: [cell] belonging to a particular vgroup value
+    cells: {vgroup: CellStore}
+    df: DataFrame being summarized
     table: parent Table
+    aggregates: {vgroup: ([group value], {var: Aggregates})}
 '''
 class Summary(BlockBase):
     def __init__(self, table=None, vars=[], title='Summary Statistics'):
         self._init_block(table, title)
         self.vars(vars)
+        self._aggregates = {}
         
     # Set the summary variables
     def vars(self, vars=[]):
@@ -35,6 +41,10 @@ class Summary(BlockBase):
     # Number of columns (variables)
     def ncols(self):
         return len(self._vars)
+        
+    # Get variables of the DataFrame used to generate the block
+    def _data_vars(self):
+        return list(self._vars)
 
     
     
@@ -43,53 +53,116 @@ class Summary(BlockBase):
     ##########################################################################
     
     # Generate a row of summary statistics cells
-    # must be assigned to a table
-    def generate(self):
-        self._df = self._table._vgroup_df
-        self._init_row('summary')
-        self._N()
-        self._mean()
-        self._std()
-        self._pctiles()
-        self._freq()
+    # arguments:
+    #   df: DataFrame of the row's vertical group value
+    #   vgroup: vertical group variable
+    #   val: vertical group value
+    def _generate_frame(self, df, vgroup, val):
+        self._generate_grouping(
+            Grouping(df, np.zeros(len(df), dtype=int), [val], vgroup))
         
-    # Compute count for a row of cells
-    def _N(self):
-        vars = self._vars
-        counts = self._df.count()
-        [self._row[v].N(counts[v]) for v in vars]
-            
-    # Compute mean for a row of cells
-    def _mean(self):
-        vars = [v for v in self._vars
-            if self._df._vars[v]['type'] != 'category']
-        means = self._df.mean()
-        [self._row[v].mean(means[v]) for v in vars]
-            
-    # Compute standard deviation for a row of cells
-    def _std(self):
-        vars = [v for v in self._vars
-            if self._df._vars[v]['type'] in ['binary','ordered','numeric']]
-        stds = self._df[vars].std()
-        [self._row[v].std(stds[v]) for v in vars]
+    # Generate rows of summary statistics cells for every value of a grouping
+    # statistics of each summary variable are computed for all values in a
+    # single grouped pass over the variable
+    # number of observations, means, standard deviations and frequencies 
+    # are kept as mergeable aggregates; those of pooled groupings are merged
+    # from the aggregates of other groupings rather than computed again 
+    # (percentiles are still computed from the values)
+    def _generate_grouping(self, grouping):
+        store = self._init_cells(
+            'summary', grouping._group, grouping._values)
+        parts = self._get_parts(grouping)
+        scan = [v for v in self._vars if parts is None 
+            or grouping._df._vars[v]['type'] == 'numeric']
+        cols = grouping._df._columns(scan)
+        aggregates = {}
+        for v in self._vars:
+            record = grouping._df._vars[v]
+            if parts is None:
+                aggregates[v] = self._compute_aggregates(
+                    record['type'], cols[v], grouping._codes, 
+                    len(grouping._values))
+            else:
+                aggregates[v] = Aggregates.merge(
+                    [(p[v], mapping) for p, mapping in parts], 
+                    len(grouping._values)+1)
+            aggregates[v].fill(store, v)
+            if record['type'] == 'numeric':
+                self._summarize_pctiles(
+                    record, v, cols[v], grouping._codes, store)
+        self._aggregates[grouping._group] = (grouping._values, aggregates)
         
-    # Compute percentiles for a row of cells
-    def _pctiles(self):
-        vars = [v for v in self._vars
-            if self._df._vars[v]['type'] == 'numeric']
-        for v in vars:
-            pctiles = self._df._vars[v]['cell_pctile']
-            vals = self._df[v].quantile(pctiles)
-            self._row[v].pctiles(list(zip(pctiles, vals)))
+    # Get the aggregates of other groupings to merge into a grouping
+    # the pooled grouping merges the aggregates of a vertical group variable
+    # of this table, and the groupings of a pooled table merge the 
+    # aggregates of the same groupings of the tables it pools
+    # return: [({var: Aggregates}, numpy array of the slot of the grouping of
+    #   each slot of the aggregates)] (None if there are none to merge)
+    def _get_parts(self, grouping):
+        if grouping._group == 'Pooled':
+            for vgroup, (values, aggregates) in self._aggregates.items():
+                if vgroup != 'Pooled':
+                    return [(aggregates, np.zeros(len(values)+1, dtype=int))]
+        if self._table._parts is None:
+            return None
+        
+        i = self._table._blocks.index(self)
+        index = {val: j for j, val in enumerate(grouping._values)}
+        parts = []
+        for blocks in self._table._parts:
+            values, aggregates = blocks[i][grouping._group]
+            parts.append((aggregates, np.array(
+                [index[val] for val in values] + [len(grouping._values)])))
+        return parts
+        
+    # Compute aggregates of a summary variable for every group
+    # arguments:
+    #   type: type of the summary variable
+    #   values: numpy array of variable values
+    #   codes: numpy array of the group of each value
+    #   ngroups: number of groups
+    # return: Aggregates
+    def _compute_aggregates(self, type, values, codes, ngroups):
+        valid = ~pd.isna(values)
+        return Aggregates.compute(
+            values[valid], codes[valid], ngroups, 
+            sums=type != 'category', 
+            M2=type in ['binary','ordered','numeric'],
+            counts=type in ['category','binary','ordered'])
     
-    # Compute value frequencies for a row of cells
-    def _freq(self):
-        vars = [v for v in self._vars
-            if self._df._vars[v]['type'] in ['category','binary','ordered']]
-        for v in vars:
-            val_counts = self._df[v].value_counts()
-            val_counts = val_counts / self._row[v]._N
-            self._row[v].freq(list(zip(val_counts.data.index, val_counts)))
+    # Compute percentiles of a numeric summary variable for every group
+    # arguments:
+    #   record: decoration of the summary variable
+    #   var: summary variable
+    #   values: numpy array of variable values
+    #   codes: numpy array of the group of each value
+    #   store: CellStore of the groups
+    def _summarize_pctiles(self, record, var, values, codes, store):
+        valid = (codes >= 0) & ~pd.isna(values)
+        values, codes = values[valid].astype(float), codes[valid]
+        N = np.bincount(codes, minlength=len(store))
+        pctiles = record['cell_pctile']
+        vals = self._grouped_quantiles(values, codes, N, pctiles)
+        store.extend('pctiles', var, [list(zip(pctiles, v)) for v in vals])
+            
+    # Compute quantiles of values in every group
+    # values are sorted once within groups, and quantiles are linearly 
+    # interpolated between sorted values (as in pandas quantile)
+    # groups with no values have missing quantiles
+    # return: [[quantile of each pctile] for each group]
+    def _grouped_quantiles(self, values, codes, N, pctiles):
+        if len(values) == 0:
+            return np.full((len(N), len(pctiles)), np.nan).tolist()
+        values = values[np.lexsort((values, codes))]
+        starts = np.cumsum(N) - N
+        vals = []
+        for p in pctiles:
+            pos = starts + p*(N-1)
+            lower = np.clip(np.floor(pos).astype(int), 0, len(values)-1)
+            upper = np.clip(np.ceil(pos).astype(int), 0, len(values)-1)
+            v = values[lower] + (values[upper]-values[lower])*(pos-lower)
+            vals.append(np.where(N > 0, v, np.nan))
+        return np.array(vals).T.tolist()
     
     
     
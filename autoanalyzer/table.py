@@ -6,24 +6,44 @@
 
 from autoanalyzer.bases.table_base import TableBase
 from autoanalyzer.bases.writer_base import WriterBase, POOLED_VAL
+from autoanalyzer.grouping import Grouping
+from autoanalyzer.layout import Layout
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+import pandas as pd
+import numpy as np
+import time
 
 '''
 Data:
     title
     tgroup_title: subtitle from table group variable
     df: DataFrame
+    source_df: the TableGenerator's DataFrame
+    rows: row positions of df in source_df
+    index: GroupIndex of the TableGenerator's DataFrame
     vgroups: {vgroup: [group value]}
     blocks: summary and analysis blocks
     row: row number
-    vgroup_index: {vertical group variable value: row}
+    layout: Layout of the table
+    vgroup_rows: [(vertical group variable, value, row)] in row order
+    threads: number of threads to generate blocks in (None: no threads)
+    parts: [block aggregates (see _block_aggregates)] of tables whose rows
+        partition the rows of a pooled table, which are merged into the 
+        pooled table's summaries (None: summaries are computed from the 
+        DataFrame)
     writer: parent Writer
 '''
 class Table(TableBase, WriterBase):
     def __init__(self, table_generator):
         self._df = table_generator._tgroup_df
+        self._source_df = table_generator._df
+        self._rows = table_generator._tgroup_rows
+        self._index = table_generator._index
         self._ws_title = table_generator._ws_title
         self._title = table_generator._title
+        self._threads = table_generator._threads
+        self._parts = table_generator._tgroup_parts
         self.tgroup_title(
             table_generator._tgroup, table_generator._tgroup_val)
         self._vgroups = deepcopy(table_generator._vgroups)
@@ -49,35 +69,67 @@ class Table(TableBase, WriterBase):
     
     # Generate table statistics
     # generate by vertical group variables and pooled
+    # each block generates its cells for all values of a grouping at once
+    # blocks and vertical group variables are independent, and are 
+    # generated concurrently in a thread pool if threads is set
+    # the pooled grouping is generated last, so that blocks can merge the 
+    # results of the vertical group variables
     def generate(self):
         self._decorate()
-        [self._generate_by_vgroup(v) for v in self._vgroups]
-        self._vgroup = 'Pooled'
-        self._generate_by_vgroup_val(pooled=True)
+        groupings = [self._get_vgroup_grouping(v) for v in self._vgroups]
+        pooled = Grouping.pooled(self._df)
+        if self._threads is None:
+            [self._generate_block(b, g) 
+                for g in groupings + [pooled] for b in self._blocks]
+            return self
+        with ThreadPoolExecutor(self._threads) as executor:
+            for stage in [groupings, [pooled]]:
+                futures = [executor.submit(self._generate_block, b, g) 
+                    for g in stage for b in self._blocks]
+                [f.result() for f in futures]
         return self
         
-    # Generate table statistics by vertical group variable
-    def _generate_by_vgroup(self, vgroup):
-        self._vgroup = vgroup
-        series, values = self._get_series_values(vgroup)
-        values = sorted(list(values))
-        self._vgroups[vgroup] = values
-        [self._generate_by_vgroup_val(series, v) for v in values]
+    # Get the grouping of the table by a vertical group variable
+    def _get_vgroup_grouping(self, vgroup):
+        grouping = self._index.grouping(vgroup, self._df, self._rows)
+        self._vgroups[vgroup] = grouping._values
+        return grouping
         
-    # Generate statistics for a single value of the vertical group variable
-    # analysis may be pooled over vertical group variable
-    # arguments:
-    #   series: Series with split values of the vertical group variable
-    #   val: selected value of the series
-    #   pooled: indicator to pool analysis over vertical groups
-    def _generate_by_vgroup_val(self, series=None, val=None, pooled=False):
-        if pooled:
-            self._vgroup_df = self._df
-            self._vgroup_val = POOLED_VAL
-        else:
-            self._vgroup_df = self._df[series==val]
-            self._vgroup_val = val
-        [b.generate() for b in self._blocks]
+    # Generate a block's cells for every value of a grouping
+    # compact the block's cells of the grouping
+    # record the generation time of the block
+    def _generate_block(self, block, grouping):
+        start = time.perf_counter()
+        block._generate_grouping(grouping)
+        block._cells[grouping._group]._compact()
+        block._timings[grouping._group] = time.perf_counter() - start
+    
+    
+    
+    # Get the summary aggregates of every block, which a pooled table 
+    # merges
+    # return: [{vgroup: ([group value], {var: Aggregates})} (None for blocks
+    #   without aggregates) for each block]
+    def _block_aggregates(self):
+        return [getattr(b, '_aggregates', None) for b in self._blocks]
+        
+    # Remove references to data from a generated table
+    # writing needs only the cells and the decoration of the DataFrame
+    # return: self
+    def _strip(self):
+        self._df = self._df._wrap(self._df.data.iloc[:0], self._df._vars)
+        self._source_df = self._rows = self._index = self._writer = None
+        self._parts = None
+        [b._strip() for b in self._blocks]
+        return self
+        
+    # Get integer codes of a variable for the rows of the table
+    # the variable is factorized once, on the TableGenerator's DataFrame
+    def _get_codes(self, var):
+        codes, _ = self._source_df._factorize(var)
+        if self._rows is None:
+            return codes
+        return codes[self._rows]
     
     
     
@@ -85,14 +137,38 @@ class Table(TableBase, WriterBase):
     # Write table
     ##########################################################################
     
-    # Write table
-    # collect arguments
-    # write title and subtitle
-    # write column labelling vertical groups and values
-    # write blocks
+    # Write table to an xlsx worksheet
+    # lay out the table, then write the layout row by row
+    # formats: {format name: xlsxwriter Format}
     # return: ending row
-    def _write(self, ws, row):
-        self._ws, self._row, self._format = ws, row, self._writer._format
+    def _write(self, ws, row, formats):
+        self._lay_out(row)._write(ws, formats)
+        return self._row
+        
+    # Get the cells of the table as records
+    # return: pandas DataFrame with columns worksheet, title, subtitle, 
+    #   block (title) and the columns of BlockBase._records
+    def _records(self):
+        vgroups = list(self._vgroups)+['Pooled']
+        blocks = [b._records(vgroups) for b in self._blocks]
+        records = {col: np.concatenate([r[col] for r in blocks]) 
+            for col in blocks[0]}
+        records = pd.DataFrame(records)
+        records.insert(0, 'block', np.repeat(
+            np.array([b._title for b in self._blocks], dtype=object),
+            [len(r['estimate']) for r in blocks]))
+        records.insert(0, 'subtitle', self._tgroup_title)
+        records.insert(0, 'title', self._title)
+        records.insert(0, 'worksheet', self._ws_title)
+        return records
+        
+    # Lay out table
+    # place title and subtitle
+    # place column labelling vertical groups and values
+    # place blocks
+    # return: Layout
+    def _lay_out(self, row):
+        self._layout, self._row = Layout(row), row
         
         self._write_table_title()
         self._write_table_title(self._tgroup_title)
@@ -105,7 +181,7 @@ class Table(TableBase, WriterBase):
         for b in self._blocks:
             b._write(block_row_start, col)
             col += b.ncols()
-        return self._row
+        return self._layout
         
     # Write table title or subtitle
     def _write_table_title(self, title=None):
@@ -113,15 +189,14 @@ class Table(TableBase, WriterBase):
             title = self._title
         self._write_title(
             self._row, 1, self._row, self.ncols(), 
-            title, self._format['center_bold'])
+            title, 'center_bold')
         self._row += 1
         
     # Write column with vertical group variables and values
-    # initialize vertical group index dictionary: {vgroup value: row}
+    # initialize the rows of vertical group values, in row order
     def _write_vgroups(self):
-        vgroups = list(self._vgroups)+['Pooled']
-        self._vgroup_index = {vgroup: {} for vgroup in vgroups}
-        [self._write_vgroup(v) for v in vgroups]
+        self._vgroup_rows = []
+        [self._write_vgroup(v) for v in list(self._vgroups)+['Pooled']]
         self._row += 1
         
     # Write a single vertical group variable and values
@@ -135,10 +210,10 @@ class Table(TableBase, WriterBase):
             label = self._df._vars[vgroup]['label']
             vals = self._vgroups[vgroup]
             
-        self._ws.write(self._row, 0, label, self._format['bold'])
+        self._layout.write(self._row, 0, label, 'bold')
         for val in vals:
             self._row += 1
-            self._ws.write(self._row, 0, str(val), self._format['default'])
-            self._vgroup_index[vgroup][val] = self._row
+            self._layout.write(self._row, 0, str(val), 'default')
+            self._vgroup_rows.append((vgroup, val, self._row))
             
         self._row += 2
\ No newline at end of file
@@ -7,6 +7,9 @@
 from autoanalyzer.data_frame import DataFrame
 from autoanalyzer.table import Table
 from autoanalyzer.bases.table_base import TableBase
+from multiprocessing.shared_memory import SharedMemory
+from copy import copy, deepcopy
+import pickle
 
 '''
 Data:
@@ -14,19 +17,23 @@ Data:
     df: DataFrame
     tgroups: {table group variable: [group value]}
     vgroups: {vertical group variable: [group value]}
+    index: GroupIndex of table and vertical group variables
+    threads: number of threads to generate the blocks of each table in 
+        (None: no threads)
     blocks: statistics blocks
     writer: parent Writer
 '''
 class TableGenerator(TableBase):
     def __init__(
             self, writer=None, worksheet='Main', title='', 
-            df=DataFrame(), tgroups=[], vgroups=[]):
+            df=DataFrame(), tgroups=[], vgroups=[], threads=None):
         self.writer(writer)
         self.worksheet(worksheet)
         self.title(title)
         self.df(df)
         self.tgroups(tgroups)
         self.vgroups(vgroups)
+        self.threads(threads)
         self._blocks = []
         
     # Set table group dictionary
@@ -37,6 +44,15 @@ class TableGenerator(TableBase):
     # Get list of table groups
     def get_tgroups(self):
         return list(self._tgroups)
+        
+    # Set number of threads to generate the blocks of each table in
+    # None generates blocks one at a time, without threads
+    def threads(self, threads=None):
+        self._threads = threads
+        
+    # Get number of threads
+    def get_threads(self):
+        return self._threads
     
     
     
@@ -45,34 +61,147 @@ class TableGenerator(TableBase):
     ##########################################################################
     
     # Generate list of tables
-    # generate tables by table group variables and pooled
+    # executor: concurrent.futures process pool to generate tables in 
+    #   (default: generate in this process)
     # return: [Table]
-    def generate(self):
+    def generate(self, executor=None):
+        return list(self._iter_tables(executor))
+        
+    # Generate tables one at a time
+    # index table and vertical group variables
+    # generate tables by table group variables and pooled
+    # the DataFrame's cache is cleared first, so that each generation sees
+    # data modified in place since the last
+    # only the summary aggregates of the tables of the table group variable
+    # which the pooled table merges are kept until the pooled table is 
+    # generated; the tables themselves are not modified
+    # executor: see generate
+    # yield: Table
+    def _iter_tables(self, executor=None):
         self._decorate()
-        tables = []
-        [tables.extend(self._generate_by_tgroup(t)) for t in self._tgroups]
-        return tables + [self._generate_by_tgroup_val(pooled=True)]
+        self._df._clear_cache()
+        self._index = self._get_group_index(
+            list(self._tgroups) + list(self._vgroups))
+        if executor is not None:
+            yield from self._generate_in_executor(executor)
+            return
+        parts = None
+        for tgroup in self._tgroups:
+            keep = parts is None and (self._index._codes[tgroup] >= 0).all()
+            tgroup_parts = []
+            for table in self._generate_by_tgroup(tgroup):
+                if keep:
+                    tgroup_parts.append(table._block_aggregates())
+                yield table
+            if keep:
+                parts = tgroup_parts
+        yield self._generate_by_tgroup_val(pooled=True, parts=parts)
         
-    # Generate list of tables split by table group variable
-    # get series and values to split DataFrame
+    # Generate tables split by table group variable
     # tgroup: table group variable
-    # return: [Table]
+    # yield: Table
     def _generate_by_tgroup(self, tgroup):
         self._tgroup = tgroup
-        series, values = self._get_series_values(tgroup)
-        self._tgroups[tgroup] = values
-        return [self._generate_by_tgroup_val(series, v) for v in values]
+        grouping = self._index.grouping(tgroup, self._df)
+        self._tgroups[tgroup] = grouping._values
+        for val, rows in zip(grouping._values, grouping.positions()):
+            yield self._generate_by_tgroup_val(val, rows)
         
     # Generate table for a single value of the table group variable
     # arguments:
-    #   series: Series with split values of table group variable
-    #   val: selected value of the series
+    #   val: selected value of the table group variable
+    #   rows: row positions of the value
     #   pooled: indicator to pool analysis over table groups
+    #   parts: [block aggregates (see Table._block_aggregates)] of the table
+    #     of every value of a table group variable with no missing values, 
+    #     which the pooled table merges
     # return: Table
-    def _generate_by_tgroup_val(self, series=None, val=None, pooled=False):
+    def _generate_by_tgroup_val(
+            self, val=None, rows=None, pooled=False, parts=None):
         if pooled:
             self._tgroup = 'Pooled'
             self._tgroup_df, self._tgroup_val = self._df, None
         else:
-            self._tgroup_df, self._tgroup_val = self._df[series==val], val
-        return Table(self).generate()
\ No newline at end of file
+            self._tgroup_df, self._tgroup_val = self._df.take(rows), val
+        self._tgroup_rows, self._tgroup_parts = rows, parts
+        return Table(self).generate()
+        
+    # Generate tables in a process pool
+    # the generator, with its DataFrame projected to the variables its 
+    # blocks use, is pickled once into shared memory and loaded once per 
+    # worker process; tasks carry only the row positions of a table group
+    # value, and workers return tables stripped of their data
+    # tables are yielded in the same order as generate, each once it and 
+    # the tables before it are generated, and are not referenced here after
+    # they are yielded
+    # yield: Table
+    def _generate_in_executor(self, executor):
+        tasks = []
+        for tgroup in self._tgroups:
+            grouping = self._index.grouping(tgroup, self._df)
+            self._tgroups[tgroup] = grouping._values
+            tasks.extend([(tgroup, val, rows) for val, rows 
+                in zip(grouping._values, grouping.positions())])
+        tasks.append(('Pooled', None, None))
+        
+        state = pickle.dumps(self._worker_copy(), pickle.HIGHEST_PROTOCOL)
+        shm = SharedMemory(create=True, size=len(state))
+        shm.buf[:len(state)] = state
+        futures = []
+        try:
+            futures = [executor.submit(
+                _generate_in_worker, shm.name, len(state), *task) 
+                for task in tasks]
+            for i in range(len(futures)):
+                table = futures[i].result()
+                futures[i] = None
+                table._writer = self._writer
+                yield table
+        finally:
+            [future.cancel() for future in futures if future is not None]
+            shm.close()
+            shm.unlink()
+        
+    # Copy of the generator to send to worker processes
+    # without the writer, with unassigned copies of the blocks, and with 
+    # the DataFrame projected to the variables used by groups and blocks
+    def _worker_copy(self):
+        vars = list(self._tgroups) + list(self._vgroups)
+        [vars.extend(b._data_vars()) for b in self._blocks]
+        out = copy(self)
+        out._writer = None
+        out._blocks = [deepcopy(b) for b in self._blocks]
+        out._df = self._df[list(dict.fromkeys(vars))]
+        return out
+        
+        
+        
+##############################################################################
+# Worker process
+##############################################################################
+
+# TableGenerator loaded in this worker process and the name of the shared 
+# memory it was loaded from
+_worker = {}
+
+# Generate a table for a single table group value in a worker process
+# arguments:
+#   name: name of the shared memory of the pickled TableGenerator
+#   size: size of the pickled TableGenerator
+#   tgroup: table group variable ('Pooled' for the pooled table)
+#   val: value of the table group variable
+#   rows: row positions of the value
+# return: Table stripped of its data
+def _generate_in_worker(name, size, tgroup, val, rows):
+    if _worker.get('name') != name:
+        shm = SharedMemory(name=name)
+        buf = shm.buf[:size]
+        _worker['table_generator'] = pickle.loads(buf)
+        _worker['name'] = name
+        buf.release()
+        shm.close()
+    table_generator = _worker['table_generator']
+    table_generator._tgroup = tgroup
+    table = table_generator._generate_by_tgroup_val(
+        val, rows, pooled=tgroup == 'Pooled')
+    return table._strip()
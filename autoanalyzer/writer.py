@@ -5,19 +5,22 @@
 ##############################################################################
 
 from autoanalyzer.table_generator import TableGenerator
-import xlsxwriter
+from autoanalyzer.backends import open_backend
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import threading
+import queue
 
 '''
 Data:
     file_name
-    worksheets: {ws title: [Worksheet, current row]}
     tables: [Table or TableGenerator]
-    generated_tables: [Table] after generate()
+    generated_tables: [Table] after write (empty in pipelined mode, in which
+        tables are released once written)
 '''
 class Writer():
     def __init__(self, file_name=None):
         self.file_name(file_name)
-        self._worksheets = {}
         self._tables = []
         self._generated_tables = []
         
@@ -28,47 +31,106 @@ class Writer():
         self._file_name = file_name
         
     # Write tables
-    def write(self):
-        self._generate_tables()
-        self._init_workbook()
-        [self._write_table(table) for table in self._generated_tables]
-        self._wb.close()
+    # arguments:
+    #   workers: number of worker processes to generate the tables of 
+    #     TableGenerators in (default: generate in this process)
+    #   streaming: indicator to write xlsx in constant memory mode, in 
+    #     which rows are flushed to disk as they are completed
+    #   format: output format (see backends.FORMATS); xlsx, html and latex
+    #     write formatted tables, csv, parquet and json write records of 
+    #     numeric estimates
+    #   pipeline: depth of the queue of generated tables waiting to be 
+    #     written by a writer thread (0: no bound; default: write each 
+    #     table in this thread once it is generated)
+    # tables are written as they are generated
+    # in pipelined mode, writing overlaps with generating the next tables, 
+    # and tables are released once written rather than kept in 
+    # generated_tables
+    def write(self, workers=None, streaming=False, format='xlsx', 
+            pipeline=None):
+        backend = open_backend(format, self._file_name, streaming)
+        try:
+            if pipeline is None:
+                self._generate_tables(workers, backend.write_table)
+            else:
+                self._write_pipelined(workers, backend, pipeline)
+        finally:
+            backend.close()
         
     # Generate tables
-    # note that 'table' may be Table or TableGenerator
-    def _generate_tables(self):
+    # write: function called with each table once it is generated (None: 
+    #   no function)
+    def _generate_tables(self, workers=None, write=None):
+        self._generated_tables = []
+        with self._executor(workers) as executor:
+            for table in self._iter_tables(executor):
+                self._generated_tables.append(table)
+                if write is not None:
+                    write(table)
+                    
+    # Generate tables in this thread while a writer thread writes them
+    # tables are handed to the writer thread through a bounded queue, so 
+    # that at most depth tables wait to be written
+    # an error in the writer thread stops generation and is raised here
+    # arguments:
+    #   workers: see write
+    #   backend: Backend
+    #   depth: maximum number of tables in the queue
+    def _write_pipelined(self, workers, backend, depth):
         self._generated_tables = []
+        tables, errors = queue.Queue(depth), []
+        writer = threading.Thread(
+            target=_write_queued, args=(tables, backend, errors))
+        writer.start()
+        try:
+            with self._executor(workers) as executor:
+                for table in self._iter_tables(executor):
+                    if errors:
+                        break
+                    tables.put(table)
+                    del table
+        finally:
+            tables.put(None)
+            writer.join()
+        if errors:
+            raise errors[0]
+            
+    # Generate tables one at a time
+    # note that 'table' may be Table or TableGenerator
+    # executor: process pool to generate the tables of TableGenerators in
+    #   (None to generate in this process)
+    # yield: Table
+    def _iter_tables(self, executor):
         for table in self._tables:
             if type(table) == TableGenerator:
-                self._generated_tables.extend(table.generate())
+                yield from table._iter_tables(executor)
             else:
-                self._generated_tables.append(table.generate())
+                yield table.generate()
+                
+    # Get a context manager of the process pool to generate tables in
+    # (a context of None if workers is None)
+    def _executor(self, workers):
+        if workers is None:
+            return nullcontext()
+        return ProcessPoolExecutor(workers)
         
-    # Initialize a new workbook
-    # initialize workbook
-    # add formats
-    def _init_workbook(self):
-        self._wb = xlsxwriter.Workbook(self._file_name+'.xlsx')
-
-        self._format = {}
-        self._format['default'] = self._wb.add_format()
-        self._format['bold'] = self._wb.add_format({'bold': True})
-        self._format['center'] = self._wb.add_format({'center_across': True})
-        self._format['center_bold'] = self._wb.add_format(
-            {'center_across': True, 'bold': True})
-        for format in self._format.values():
-            format.set_text_wrap(True)
-            format.set_align('vcenter')
-           
-    # Write a single table to the workbook
-    # if table belongs to new worksheet, initialize worksheet
-    # write table to worksheet
-    def _write_table(self, table):
-        ws_title = table._ws_title
-        if ws_title not in self._worksheets:
-            ws = self._wb.add_worksheet(ws_title)
-            ws.set_column(0, 99, width=20)
-            self._worksheets[ws_title] = [ws, 0]
-            
-        self._worksheets[ws_title][1] = table._write(
-            *self._worksheets[ws_title]) - 1
\ No newline at end of file
+        
+        
+# Write tables from a queue until it yields None
+# after an error, tables are taken from the queue but not written, so that
+# the generating thread is not blocked
+# arguments:
+#   tables: queue.Queue of Tables
+#   backend: Backend
+#   errors: list to append an error to
+def _write_queued(tables, backend, errors):
+    while True:
+        table = tables.get()
+        if table is None:
+            return
+        if not errors:
+            try:
+                backend.write_table(table)
+            except Exception as e:
+                errors.append(e)
+        del table
@@ -0,0 +1,222 @@
+##############################################################################
+# Benchmarks
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+from autoanalyzer import *
+from autoanalyzer.estimators import ols
+from autoanalyzer.backends import open_backend
+from timeit import timeit
+import tempfile
+import time
+import os
+import statsmodels.api as sm
+import numpy as np
+import pandas as pd
+
+# Print the time per call of an autoanalyzer statement and the equivalent 
+# pandas statement
+def compare(name, stmt, pd_stmt, number):
+    t = timeit(stmt, number=number, globals=globals()) / number
+    t_pd = timeit(pd_stmt, number=number, globals=globals()) / number
+    print('{:<30} {:>10.2f} us {:>10.2f} us {:>10.2f} us'.format(
+        name, t*1e6, t_pd*1e6, (t-t_pd)*1e6))
+
+
+
+##############################################################################
+# Forwarding overhead
+##############################################################################
+
+def bench_forwarding(ncols=200, nrows=1000, number=10000):
+    global df, pdf
+    pdf = pd.DataFrame(
+        np.random.randn(nrows, ncols), 
+        columns=['x{}'.format(i) for i in range(ncols)])
+    df = DataFrame(pdf)
+    df.decorate()
+    
+    print('Forwarding overhead ({} columns, {} rows)'.format(ncols, nrows))
+    print('{:<30} {:>13} {:>13} {:>13}'.format(
+        'call', 'autoanalyzer', 'pandas', 'overhead'))
+    compare("df['x0']", "df['x0']", "pdf['x0']", number)
+    compare("abs(df['x0'])", "abs(df['x0'])", "abs(pdf['x0'])", number)
+    compare("df['x0'] + df['x1']", 
+        "df['x0'] + df['x1']", "pdf['x0'] + pdf['x1']", number)
+    compare('len(df)', 'len(df)', 'len(pdf)', number)
+    compare('df.shape', 'df.shape', 'pdf.shape', number)
+    compare('df.mean()', 'df.mean()', 'pdf.mean()', number//10)
+    print()
+
+
+
+##############################################################################
+# Type inference
+##############################################################################
+
+# Type inference before vectorization, for comparison
+def infer_types_by_set(df):
+    types = {}
+    for var in df:
+        values = set(df.data[var].dropna())
+        try:
+            num_vals = len([float(i) for i in values])
+            if num_vals == 1:
+                types[var] = 'unary'
+            elif num_vals == 2:
+                types[var] = 'binary'
+            elif num_vals < 10:
+                types[var] = 'ordered'
+            else:
+                types[var] = 'numeric'
+        except:
+            types[var] = 'category'
+    return types
+
+# Frame with numeric, ordered, binary and category columns
+def mixed_frame(nrows, ncols):
+    data = {}
+    for i in range(ncols):
+        if i % 4 == 0:
+            data['x{}'.format(i)] = np.random.randn(nrows)
+        elif i % 4 == 1:
+            data['x{}'.format(i)] = np.random.randint(0, 5, nrows)
+        elif i % 4 == 2:
+            data['x{}'.format(i)] = np.random.randint(0, 2, nrows)
+        else:
+            data['x{}'.format(i)] = np.random.choice(['a', 'b', 'c'], nrows)
+    return DataFrame(pd.DataFrame(data))
+
+def bench_infer_types(shapes=[(1000, 1000), (2000000, 8)], number=3):
+    global df
+    print('Type inference')
+    print('{:<30} {:>13} {:>13}'.format('rows x columns', 'nunique', 'set'))
+    for nrows, ncols in shapes:
+        df = mixed_frame(nrows, ncols)
+        t = timeit(
+            'df.clear_types(); df.infer_types()', 
+            number=number, globals=globals()) / number
+        t_set = timeit(
+            'infer_types_by_set(df)', 
+            number=number, globals=globals()) / number
+        print('{:<30} {:>11.3f} s {:>11.3f} s'.format(
+            '{} x {}'.format(nrows, ncols), t, t_set))
+    print()
+
+
+
+##############################################################################
+# OLS engines
+##############################################################################
+
+# Largest difference in params, bse, tvalues and pvalues between the 
+# minimal OLS estimator and statsmodels
+def ols_difference(y, X, cov_type, cov_kwds={}, clusters=None):
+    results = ols.fit(y, X, cov_type, clusters)
+    sm_results = sm.OLS(y, X).fit(cov_type=cov_type, cov_kwds=cov_kwds)
+    return max([np.abs(getattr(results, a) - getattr(sm_results, a)).max()
+        for a in ['params', 'bse', 'tvalues', 'pvalues']])
+
+def bench_ols_engines(sizes=[100, 100000], k=5, number=20):
+    global y, X, clusters, cov_type, cov_kwds
+    print('OLS engines (time per fit and cell statistics, {} regressors)'
+        .format(k))
+    print('{:<30} {:>13} {:>13} {:>13}'.format(
+        'N, cov_type', 'numpy', 'statsmodels', 'max diff'))
+    for n in sizes:
+        X = np.column_stack([np.random.randn(n, k-1), np.ones(n)])
+        y = X.sum(axis=1) + np.random.randn(n)
+        clusters = np.random.randint(0, max(n//10, 2), n)
+        for cov_type in ['nonrobust', 'HC1', 'cluster']:
+            cov_kwds = {'groups': clusters} if cov_type == 'cluster' else {}
+            t = timeit(
+                'ols.fit(y, X, cov_type, clusters)', 
+                number=number, globals=globals()) / number
+            t_sm = timeit(
+                'r = sm.OLS(y, X).fit(cov_type=cov_type, cov_kwds=cov_kwds);'
+                'r.params, r.bse, r.tvalues, r.pvalues',
+                number=number, globals=globals()) / number
+            diff = ols_difference(y, X, cov_type, cov_kwds, clusters)
+            print('{:<30} {:>10.2f} ms {:>10.2f} ms {:>13.1e}'.format(
+                '{}, {}'.format(n, cov_type), t*1e3, t_sm*1e3, diff))
+    print()
+
+
+
+##############################################################################
+# Block threads
+##############################################################################
+
+# Frame with a continuous outcome, regressors, clusters and vertical groups
+def regression_frame(nrows, ngroups):
+    data = pd.DataFrame({
+        'x': np.random.randn(nrows), 'z': np.random.randn(nrows),
+        'g': np.random.randint(0, ngroups, nrows),
+        'h': np.random.randint(0, 10, nrows),
+        'c': np.random.randint(0, nrows//100, nrows)})
+    data['y'] = data['x'] + np.random.randn(nrows)
+    df = DataFrame(data)
+    df.types({'g': 'category', 'h': 'category'})
+    return df
+
+# Print generation time per block, without and with threads
+def bench_threads(nrows=1000000, ngroups=300, threads=[None, 4]):
+    df = regression_frame(nrows, ngroups)
+    print('Block threads ({} rows, {} vgroup values)'.format(nrows, ngroups))
+    for n in threads:
+        tg = TableGenerator(df=df, vgroups=['g', 'h'], threads=n)
+        Summary(tg, vars=['x', 'y', 'z'])
+        Analysis(tg, y='y', regressors=['x', 'z'], cov_type='HC1')
+        Analysis(
+            tg, y='y', regressors=['x', 'z'], 
+            cov_type='cluster', cov_kwds={'groups': 'c'})
+        start = time.perf_counter()
+        table = tg.generate()[0]
+        total = time.perf_counter() - start
+        print('threads = {}: {:.3f} s'.format(n, total))
+        for b in table.get_blocks():
+            timings = b.get_timings()
+            print('    {:<30} {}'.format(b.get_title(), ', '.join(
+                '{} {:.3f} s'.format(v, t) for v, t in timings.items())))
+    print()
+
+
+
+
+##############################################################################
+# Output backends
+##############################################################################
+
+# Print time to write the same generated tables in every output format
+# tables are generated once, then written by each backend
+def bench_backends(
+        nrows=100000, ngroups=500, formats=[
+            'xlsx', 'csv', 'parquet', 'json', 'html', 'latex']):
+    df = regression_frame(nrows, ngroups)
+    tg = TableGenerator(df=df, vgroups=['g', 'h'])
+    Summary(tg, vars=['x', 'y', 'z', 'h'])
+    Analysis(tg, y='y', regressors=['x', 'z'], cov_type='HC1')
+    tables = tg.generate()
+    print('Output backends ({} vgroup values)'.format(ngroups))
+    with tempfile.TemporaryDirectory() as dir:
+        for format in formats:
+            try:
+                backend = open_backend(format, os.path.join(dir, 'out'))
+            except ImportError as e:
+                print('{:<8} skipped ({})'.format(format, e))
+                continue
+            start = time.perf_counter()
+            [backend.write_table(t) for t in tables]
+            backend.close()
+            total = time.perf_counter() - start
+            print('{:<8} {:.3f} s'.format(format, total))
+    print()
+
+
+if __name__ == '__main__':
+    bench_forwarding()
+    bench_infer_types()
+    bench_ols_engines()
+    bench_threads()
+    bench_backends()
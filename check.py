@@ -0,0 +1,336 @@
+##############################################################################
+# Checks
+# by Dillon Bowen
+# last modified 10/17/2026
+##############################################################################
+
+from autoanalyzer import *
+from autoanalyzer.estimators import ols
+import statsmodels.api as sm
+import tempfile
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Generate the tables of a TableGenerator and write them to a temporary 
+# workbook
+# return: [Table]
+def write_tables(tg_kwargs, blocks):
+    with tempfile.TemporaryDirectory() as dir:
+        w = Writer(file_name=os.path.join(dir, 'out'))
+        tg = TableGenerator(w, **tg_kwargs)
+        [block(tg) for block in blocks]
+        w.write()
+    return w._generated_tables
+
+# Get a cell of the first block of a table
+def get_cell(table, vgroup, val, var, block=0):
+    return table._blocks[block]._cells[vgroup].cell(val, var)
+
+
+
+##############################################################################
+# DataFrame
+##############################################################################
+
+# Setting a pandas property before it is read sets the data
+def check_set_property():
+    df = DataFrame({'a': [1, 2], 'b': [3, 4]})
+    df.columns = ['x', 'y']
+    assert list(df.data.columns) == ['x', 'y'], df.data.columns
+    assert 'columns' not in vars(df)
+    s = df['x']
+    s.name = 'z'
+    assert s.data.name == 'z', s.data.name
+
+# Setting a column keeps its set type and clears its inferred type
+def check_setitem_types():
+    df = DataFrame({'a': [1, 2, 3], 'b': [1, 1, 2]})
+    df.types({'a': 'category'})
+    df.decorate()
+    df['a'] = [4, 5, 6]
+    df['b'] = [1.5, 2.5, 3.5]
+    df.decorate()
+    assert df.get_types() == {'a': 'category', 'b': 'ordered'}, (
+        df.get_types())
+
+# Types inferred from samples of rows are the same every time
+def check_sampled_types():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 5, 10000).astype(object)
+    x[rng.random(10000) < .002] = 'a'
+    df = DataFrame({'x': x, 'y': rng.normal(size=10000)})
+    inferred = []
+    for i in range(20):
+        df.clear_types()
+        df.infer_types(sample=50, max_rows=100)
+        inferred.append((df.get_types(), df.get_sampled_types()))
+    assert all(i == inferred[0] for i in inferred), inferred
+
+# Group bins of a frame do not depend on whether the frame it was derived
+# from was binned first, and are recomputed when tables are generated after
+# the data are modified in place
+def check_group_bins():
+    df = DataFrame({'x': np.arange(8.)})
+    df.types({'x': 'numeric'})
+    df.decorate()
+    subset = df.take(range(4))
+    df._get_group_bins('x')
+    edges, labels = df.take(range(4))._get_group_bins('x')
+    assert np.array_equal(edges, subset._get_group_bins('x')[0])
+    assert np.array_equal(edges, [0, .75, 1.5, 2.25, 3]), edges
+    
+    df = DataFrame({'x': np.arange(8.), 'y': np.arange(8.)})
+    df.types({'x': 'numeric', 'y': 'numeric'})
+    tg_kwargs = {'df': df, 'vgroups': ['x']}
+    blocks = [lambda tg: Summary(tg, vars=['y'])]
+    write_tables(tg_kwargs, blocks)
+    df.data.loc[:, 'x'] = np.arange(8.) * 10
+    table = write_tables(tg_kwargs, blocks)[0]
+    assert list(table._blocks[0]._cells['x'])[-1].right == 70, (
+        list(table._blocks[0]._cells['x']))
+
+
+
+##############################################################################
+# Tables
+##############################################################################
+
+# Tables of every table group variable are returned in the same state,
+# whether or not the pooled table merges their summaries
+def check_generated_tables():
+    df = DataFrame({
+        'x': [1., 2., 3., 4., 5., 6.], 't': [0, 0, 1, 1, 2, 2],
+        'u': [0, 1, 0, 1, 0, np.nan]})
+    df.types({'x': 'numeric', 't': 'category', 'u': 'category'})
+    tg = TableGenerator(Writer(), df=df, tgroups=['t', 'u'])
+    Summary(tg, vars=['x'])
+    tables = tg.generate()
+    assert len(tables) == 6, len(tables)
+    for table in tables[:-1]:
+        assert table._source_df is df and table._writer is not None
+        assert len(table._df) == len(table._rows) > 0, table._tgroup_title
+        assert table._index is not None, table._tgroup_title
+    pooled = get_cell(tables[-1], 'Pooled', '---', 'x')
+    assert pooled._get('N') == 6 and pooled._get('mean') == 3.5
+
+
+
+##############################################################################
+# Summary
+##############################################################################
+
+# Percentiles of a numeric variable with no values in a table are missing
+def check_empty_pctiles():
+    df = DataFrame({
+        'x': [1., 2., 3., np.nan, np.nan, np.nan], 't': [0, 0, 0, 1, 1, 1],
+        'g': [0, 1, 0, 1, 0, 1]})
+    df.types({'x': 'numeric', 't': 'category', 'g': 'category'})
+    tables = write_tables(
+        {'df': df, 'tgroups': 't', 'vgroups': ['g']},
+        [lambda tg: Summary(tg, vars=['x'])])
+    table = [t for t in tables if t._tgroup_title.endswith('= 1')][0]
+    for val in [0, 1]:
+        pctiles = get_cell(table, 'g', val, 'x')._get('pctiles')
+        assert all(np.isnan(v) for p, v in pctiles), pctiles
+
+# Frequency keys of an integer variable are its original values
+def check_freq_keys():
+    df = DataFrame({'x': [1, 2, 2, 3, 1, 1], 'g': [0, 1, 0, 1, 0, 1]})
+    df.types({'x': 'ordered', 'g': 'category'})
+    tables = write_tables(
+        {'df': df, 'vgroups': ['g']}, [lambda tg: Summary(tg, vars=['x'])])
+    for vgroup, val in [('g', 0), ('Pooled', '---')]:
+        cell = get_cell(tables[0], vgroup, val, 'x')
+        keys = [key for key, freq in cell._get('freq')]
+        assert all(isinstance(key, (int, np.integer)) for key in keys), keys
+        assert '1.0' not in cell._text(), cell._text()
+
+
+
+
+##############################################################################
+# Analysis
+##############################################################################
+
+# Results of a vertical group value with no complete rows are missing, for
+# every engine and covariance type
+def check_empty_group_results():
+    rng = np.random.default_rng(0)
+    df = DataFrame({
+        'x': rng.normal(size=60), 'g': np.repeat([0, 1, 2], 20),
+        'c': rng.integers(0, 5, 60)})
+    df['y'] = df['x'] + rng.normal(size=60)
+    df.data.loc[df.data['g'] == 1, 'y'] = np.nan
+    df.types({'x': 'numeric', 'y': 'numeric', 'g': 'category'})
+    for engine in ['grouped', 'numpy', 'statsmodels']:
+        for cov_type, cov_kwds in [
+                ('nonrobust', {}), ('HC1', {}), ('HC3', {}),
+                ('cluster', {'groups': 'c'})]:
+            tables = write_tables(
+                {'df': df, 'vgroups': ['g']},
+                [lambda tg: Analysis(
+                    tg, y='y', regressors=['x', '_const'], 
+                    cov_type=cov_type, cov_kwds=cov_kwds, engine=engine)])
+            cell = get_cell(tables[0], 'g', 1, 'x')
+            assert np.isnan(cell._get('param')), (engine, cov_type)
+            assert np.isnan(cell._get('bse')), (engine, cov_type)
+            cell = get_cell(tables[0], 'g', 0, 'x')
+            assert not np.isnan(cell._get('bse')), (engine, cov_type)
+
+
+
+
+# The streaming engine, reading the regression variables from chunks of a
+# csv, matches the in-memory fit of every table and vertical group value
+def check_streaming_analysis():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'x': rng.normal(size=1000), 't': rng.integers(0, 3, 1000),
+        'g': rng.integers(0, 4, 1000), 'c': rng.integers(0, 40, 1000)})
+    data['y'] = data['x'] + rng.normal(size=1000)
+    data.loc[data['g'] == 3, 'y'] = np.nan
+    types = {'t': 'category', 'g': 'category'}
+    with tempfile.TemporaryDirectory() as dir:
+        path = os.path.join(dir, 'data.csv')
+        data.to_csv(path, index=False)
+        for cov_type, cov_kwds in [
+                ('nonrobust', {}), ('cluster', {'groups': 'c'})]:
+            df = DataFrame(data)
+            df.types(types)
+            expected = write_tables(
+                {'df': df, 'tgroups': ['t'], 'vgroups': ['g']},
+                [lambda tg: Analysis(
+                    tg, y='y', regressors=['x'], cov_type=cov_type, 
+                    cov_kwds=cov_kwds)])
+            df = read_csv(path, usecols=['t', 'g'])
+            df.types(types)
+            tables = write_tables(
+                {'df': df, 'tgroups': ['t'], 'vgroups': ['g']},
+                [lambda tg: Analysis(
+                    tg, y='y', regressors=['x'], cov_type=cov_type, 
+                    cov_kwds=cov_kwds, engine='streaming', 
+                    chunks=read_csv_chunks(path, 300))])
+            for table, expected_table in zip(tables, expected):
+                for vgroup, val in [('g', v) for v in range(4)] + [
+                        ('Pooled', '---')]:
+                    cell = get_cell(table, vgroup, val, 'x')
+                    expected_cell = get_cell(expected_table, vgroup, val, 'x')
+                    for field in ['param', 'bse', 'tvalue', 'pvalue']:
+                        assert np.allclose(
+                            cell._get(field), expected_cell._get(field), 
+                            rtol=0, atol=1e-10, equal_nan=True), (
+                            cov_type, vgroup, val, field)
+
+
+
+##############################################################################
+# Backends
+##############################################################################
+
+# JSON output of several tables is valid JSON Lines, and reads back with 
+# every record
+def check_json_lines():
+    df = DataFrame({'x': [1., 2., 3., 4.], 't': [0, 0, 1, 1]})
+    df.types({'x': 'numeric', 't': 'category'})
+    with tempfile.TemporaryDirectory() as dir:
+        w = Writer(file_name=os.path.join(dir, 'out'))
+        tg = TableGenerator(w, df=df, tgroups=['t'])
+        Summary(tg, vars=['x'])
+        w.write(format='json')
+        with open(os.path.join(dir, 'out.jsonl')) as f:
+            lines = f.read().split('\n')
+        records = pd.read_json(os.path.join(dir, 'out.jsonl'), lines=True)
+    assert lines[-1] == '' and all(lines[:-1]), lines.count('')
+    [json.loads(line) for line in lines[:-1]]
+    tables = w._generated_tables
+    assert len(tables) > 1
+    assert len(records) == sum(len(t._records()) for t in tables), (
+        len(records))
+
+
+
+##############################################################################
+# Estimators
+##############################################################################
+
+# Results of the numpy and grouped OLS engines match statsmodels to within
+# 1e-10, for every supported covariance type
+def check_ols_statsmodels():
+    rng = np.random.default_rng(0)
+    n, k = 500, 4
+    X = np.column_stack([rng.normal(size=(n, k-1)), np.ones(n)])
+    y = X.sum(axis=1) + rng.normal(size=n)
+    codes = rng.integers(0, 2, n)
+    clusters = rng.integers(0, 40, n)
+    for cov_type in ols.COV_TYPES:
+        results = [ols.fit(y, X, cov_type, clusters)]
+        sm_results = [_sm_ols(y, X, cov_type, clusters)]
+        grouped = ols.grouped_ols(y, X, codes, 2, cov_type, clusters)
+        for g in range(2):
+            results.append(ols.OLSResults(grouped, g))
+            sm_results.append(_sm_ols(
+                y[codes == g], X[codes == g], cov_type, 
+                clusters[codes == g]))
+        for r, sm_r in zip(results, sm_results):
+            for attr in ['params', 'bse', 'tvalues', 'pvalues']:
+                diff = np.abs(getattr(r, attr) - getattr(sm_r, attr)).max()
+                assert diff < 1e-10, (cov_type, attr, diff)
+
+# Degrees of freedom absorbed by fixed effects are the rank of their 
+# dummies, also when the levels of two fixed effects are disconnected
+def check_absorbed_df():
+    rng = np.random.default_rng(0)
+    f1 = rng.integers(0, 4, 200)
+    f2 = np.where(f1 < 2, rng.integers(0, 2, 200), rng.integers(2, 4, 200))
+    codes = rng.integers(0, 2, 200)
+    A, df_absorbed = ols.grouped_demean(
+        rng.normal(size=(200, 1)), codes, 2, [f1, f2])
+    for g in range(2):
+        dummies = np.column_stack([
+            pd.get_dummies(f[codes == g]).to_numpy(float) for f in [f1, f2]])
+        assert df_absorbed[g] == np.linalg.matrix_rank(dummies), df_absorbed
+
+# Streaming OLS over chunks of rows matches grouped OLS on all rows
+def check_streaming_ols():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'x': rng.normal(size=1000), 'g': rng.integers(0, 3, 1000),
+        'c': rng.integers(0, 50, 1000)})
+    df['y'] = df['x'] + rng.normal(size=1000)
+    X = np.column_stack([df['x'], np.ones(len(df))])
+    for cov_type in ['nonrobust', 'cluster']:
+        cov_kwds = {'groups': 'c'} if cov_type == 'cluster' else {}
+        values, results = StreamingOLS(
+            'y', ['x', '_const'], 'g', cov_type, cov_kwds).fit(
+            [df.iloc[i:i+300] for i in range(0, len(df), 300)])
+        grouped = ols.grouped_ols(
+            df['y'].to_numpy(), X, df['g'].to_numpy(), 3, cov_type, 
+            df['c'].to_numpy())
+        assert values == [0, 1, 2], values
+        for attr in ['params', 'bse', 'pvalues']:
+            diff = np.abs(getattr(results, attr) - getattr(grouped, attr))
+            assert diff.max() < 1e-10, (cov_type, attr, diff.max())
+
+# Fit OLS with statsmodels
+def _sm_ols(y, X, cov_type, clusters):
+    cov_kwds = {'groups': clusters} if cov_type == 'cluster' else {}
+    return sm.OLS(y, X).fit(cov_type=cov_type, cov_kwds=cov_kwds)
+
+
+if __name__ == '__main__':
+    check_set_property()
+    check_setitem_types()
+    check_sampled_types()
+    check_group_bins()
+    check_generated_tables()
+    check_empty_pctiles()
+    check_freq_keys()
+    check_empty_group_results()
+    check_streaming_analysis()
+    check_json_lines()
+    check_ols_statsmodels()
+    check_absorbed_df()
+    check_streaming_ols()
+    print('All checks passed')